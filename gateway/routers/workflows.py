@@ -4,6 +4,7 @@ Workflow trigger endpoints for Phoenix Gateway.
 Endpoints:
 - POST /api/v1/workflows/companies - Trigger CompanyCreationWorkflow
 - POST /api/v1/workflows/articles - Trigger ArticleCreationWorkflow
+- POST /api/v1/workflows/news-monitor - Queue an app on NewsMonitorBatcherWorkflow
 - GET /api/v1/workflows/{workflow_id}/status - Check workflow status
 - GET /api/v1/workflows/{workflow_id}/result - Get workflow result (blocking)
 """
@@ -28,6 +29,9 @@ router = APIRouter(
 # Task queue from environment
 TASK_QUEUE = os.getenv("TEMPORAL_TASK_QUEUE", "phoenix-queue")
 
+# Single long-lived batcher that coalesces per-app news monitor requests
+NEWS_MONITOR_BATCHER_ID = "news-monitor-batcher"
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
@@ -56,6 +60,16 @@ class ArticleWorkflowRequest(BaseModel):
     exclude_paywalls: bool = True
 
 
+class NewsMonitorRequest(BaseModel):
+    """Request to monitor news for one app."""
+    app: str = "placement"
+    keywords: Optional[List[str]] = None
+    query: Optional[str] = None
+    min_relevance_score: float = 0.7
+    auto_create_articles: bool = True
+    max_articles_to_create: int = 5
+
+
 class WorkflowStartResponse(BaseModel):
     """Response when workflow is started."""
     workflow_id: str
@@ -194,6 +208,52 @@ async def create_article(request: ArticleWorkflowRequest):
         )
 
 
+# ============================================================================
+# NEWS MONITOR ENDPOINTS
+# ============================================================================
+
+@router.post("/news-monitor", response_model=WorkflowStartResponse)
+async def monitor_news(request: NewsMonitorRequest):
+    """
+    Queue a news monitor run for one app.
+
+    Signals `monitor_app` on the NewsMonitorBatcherWorkflow, starting it
+    if it isn't running (signal-with-start). Requests that arrive within
+    one flush interval are assessed together in one multi-app LLM call.
+
+    Timeline: up to 5 minutes queued, then 2-10 minutes
+    """
+    client = await TemporalClientManager.get_client()
+
+    # Prepare input (NewsMonitorWorkflow input; unset fields use app defaults)
+    workflow_input = request.model_dump(exclude_none=True)
+
+    try:
+        # Signal-with-start: the batcher runs with default settings
+        await client.start_workflow(
+            "NewsMonitorBatcherWorkflow",
+            {},
+            id=NEWS_MONITOR_BATCHER_ID,
+            task_queue=TASK_QUEUE,
+            start_signal="monitor_app",
+            start_signal_args=[workflow_input],
+        )
+
+        return WorkflowStartResponse(
+            workflow_id=NEWS_MONITOR_BATCHER_ID,
+            status="queued",
+            started_at=datetime.utcnow().isoformat(),
+            message=f"News monitor queued for {request.app}. Runs with the next batch.",
+            task_queue=TASK_QUEUE
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to queue news monitor: {str(e)}"
+        )
+
+
 # ============================================================================
 # WORKFLOW STATUS ENDPOINTS
 # ============================================================================
@@ -61,6 +61,15 @@ CREATE INDEX IF NOT EXISTS idx_articles_app_published ON articles(app, published
 CREATE INDEX IF NOT EXISTS idx_articles_slug ON articles(slug);
 CREATE INDEX IF NOT EXISTS idx_articles_created ON articles(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_articles_type ON articles(article_type);
+
+-- Activity blobs (large activity payloads kept out of workflow history)
+CREATE TABLE IF NOT EXISTS activity_blobs (
+    key TEXT PRIMARY KEY,
+    data JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_activity_blobs_created ON activity_blobs(created_at);
 """
 
 
@@ -76,7 +85,7 @@ async def init_database():
             await conn.commit()
 
     print("Schema initialized successfully!")
-    print("Tables created: companies, articles")
+    print("Tables created: companies, articles, activity_blobs")
 
 
 if __name__ == "__main__":
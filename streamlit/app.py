@@ -356,13 +356,30 @@ def main():
         )
 
         if st.button("🔍 Run News Monitor", type="primary", key="monitor_btn"):
-            st.warning("News Monitor endpoint not yet implemented in Gateway")
-            st.info(
-                "To run manually, use Temporal Cloud UI to start:\n"
-                f"- Workflow: NewsMonitorWorkflow\n"
-                f"- Input: {{\"app\": \"{monitor_app}\", \"max_articles_to_create\": {monitor_max}}}"
+            response = make_api_request(
+                "POST",
+                "/api/v1/workflows/news-monitor",
+                json={
+                    "app": monitor_app,
+                    "min_relevance_score": monitor_relevance,
+                    "max_articles_to_create": monitor_max
+                },
+                timeout=30
             )
 
+            if response and response.status_code == 200:
+                result = response.json()
+                st.success(f"✅ {result.get('message')}")
+                st.info("Requests are batched for up to 5 minutes, then assessed together")
+
+                st.markdown(
+                    f"[View in Temporal Cloud]"
+                    f"(https://cloud.temporal.io/namespaces/quickstart-quest.zivkb/"
+                    f"workflows/{result.get('workflow_id')})"
+                )
+            elif response:
+                st.error(f"Error: {response.text}")
+
         st.divider()
 
         # App keywords reference
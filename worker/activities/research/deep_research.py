@@ -15,7 +15,7 @@ from typing import Dict, Any, List, Optional
 from temporalio import activity
 
 from .serper import serper_multi_page_news, serper_company_news, serper_topic_research
-from .url_filter import smart_filter_urls
+from .url_filter import smart_filter_urls, check_urls_accessibility, is_dead_link
 from .crawl_fallback import crawl_with_fallback
 
 
@@ -79,6 +79,12 @@ async def deep_research_company(
 
     activity.logger.info(f"Filtered to {len(filtered_urls)} URLs for crawling")
 
+    # Dead links would otherwise run the whole crawler fallback chain
+    checks = await check_urls_accessibility(filtered_urls)
+    filtered_urls = [check["url"] for check in checks if not is_dead_link(check)]
+
+    activity.logger.info(f"{len(filtered_urls)} URLs reachable")
+
     # ========== STEP 3: PARALLEL DEEP CRAWL ==========
     # Use asyncio.gather to crawl all URLs in parallel
     crawl_tasks = [crawl_with_fallback(url) for url in filtered_urls]
@@ -219,6 +225,12 @@ async def deep_research_article(
 
     activity.logger.info(f"Filtered to {len(filtered_urls)} URLs for crawling")
 
+    # Dead links would otherwise run the whole crawler fallback chain
+    checks = await check_urls_accessibility(filtered_urls)
+    filtered_urls = [check["url"] for check in checks if not is_dead_link(check)]
+
+    activity.logger.info(f"{len(filtered_urls)} URLs reachable")
+
     # ========== STEP 3: PARALLEL DEEP CRAWL ==========
     crawl_tasks = [crawl_with_fallback(url) for url in filtered_urls]
 
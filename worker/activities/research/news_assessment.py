@@ -7,12 +7,20 @@ AI-powered relevance assessment for news stories using:
 - Pydantic AI (structured outputs)
 """
 
-from typing import Dict, Any, List, Literal, Optional
+import asyncio
+import math
+import re
+from collections import Counter
+from typing import Dict, Any, List, Literal, Optional, Tuple
 from pydantic import BaseModel, Field
 from temporalio import activity
 from pydantic_ai import Agent
 
 from config import config
+from config.apps import classify_topic, get_app_config
+from models.news import Priority
+from ..storage.neon import load_blobs
+from ..storage.zep_hybrid import get_zep_context_for_generation
 
 
 # ============================================================================
@@ -40,6 +48,24 @@ class StoryRelevance(BaseModel):
     )
 
 
+_PRIORITY_BY_NAME = {
+    "high": Priority.HIGH,
+    "medium": Priority.MEDIUM,
+    "low": Priority.LOW,
+}
+
+
+class AppStoryRelevance(StoryRelevance):
+    """Assessment of one numbered story within a multi-app batch."""
+    app: str = Field(description="App section the story belongs to")
+    story_index: int = Field(description="Story number within its app section")
+
+
+class MultiAppAssessment(BaseModel):
+    """One assessment per story across all app sections."""
+    assessments: List[AppStoryRelevance]
+
+
 class NewsAssessmentResult(BaseModel):
     """Result of assessing multiple news stories."""
     stories_assessed: int
@@ -55,14 +81,7 @@ class NewsAssessmentResult(BaseModel):
 # AI AGENT FOR NEWS ASSESSMENT
 # ============================================================================
 
-def get_news_assessment_agent():
-    """Create Pydantic AI agent for news assessment."""
-    provider, model = config.get_ai_model()
-
-    return Agent(
-        model=f"{provider}:{model}",
-        result_type=StoryRelevance,
-        system_prompt="""You are a news editor assessing stories for relevance to a specific industry app.
+_ASSESSMENT_SYSTEM_PROMPT = """You are a news editor assessing stories for relevance to a specific industry app.
 
 Your job is to:
 1. Determine if a story is relevant for the given app and its audience
@@ -79,6 +98,27 @@ For story_type:
 - "update": New information on something we've covered
 - "saga": Part of an ongoing series (e.g., deal that's been developing)
 """
+
+
+def get_news_assessment_agent():
+    """Create Pydantic AI agent for news assessment."""
+    provider, model = config.get_ai_model()
+
+    return Agent(
+        model=f"{provider}:{model}",
+        result_type=StoryRelevance,
+        system_prompt=_ASSESSMENT_SYSTEM_PROMPT
+    )
+
+
+def get_multi_app_assessment_agent():
+    """Create Pydantic AI agent that assesses several apps' stories at once."""
+    provider, model = config.get_ai_model()
+
+    return Agent(
+        model=f"{provider}:{model}",
+        result_type=MultiAppAssessment,
+        system_prompt=_ASSESSMENT_SYSTEM_PROMPT
     )
 
 
@@ -86,6 +126,41 @@ For story_type:
 # NEWS ASSESSMENT ACTIVITIES
 # ============================================================================
 
+def _app_context_lines(
+    app: str,
+    app_keywords: List[str],
+    zep_context: Dict[str, Any],
+    neon_recent: List[Dict[str, Any]]
+) -> List[str]:
+    """Prompt lines describing an app and its existing coverage."""
+    context_parts = []
+
+    # App context
+    context_parts.append(f"\nAPP: {app}")
+    context_parts.append(f"Keywords: {', '.join(app_keywords)}")
+
+    # Zep context (existing coverage)
+    if zep_context.get("articles"):
+        context_parts.append(f"\nEXISTING COVERAGE IN ZEP ({len(zep_context['articles'])} articles):")
+        for article in zep_context["articles"][:5]:
+            context_parts.append(f"- {article.get('title', '')}")
+
+    # Neon context (recently published)
+    if neon_recent:
+        context_parts.append(f"\nRECENTLY PUBLISHED ({len(neon_recent)} articles):")
+        for article in neon_recent[:5]:
+            context_parts.append(f"- {article.get('title', '')} ({article.get('published_at', '')})")
+
+    # Related entities from Zep
+    if zep_context.get("companies"):
+        context_parts.append(f"\nKNOWN COMPANIES: {', '.join([c.get('name', '') for c in zep_context['companies'][:10]])}")
+
+    if zep_context.get("deals"):
+        context_parts.append(f"\nKNOWN DEALS: {', '.join([d.get('name', '') for d in zep_context['deals'][:10]])}")
+
+    return context_parts
+
+
 @activity.defn
 async def assess_story_relevance(
     story: Dict[str, Any],
@@ -120,28 +195,8 @@ async def assess_story_relevance(
     context_parts.append(f"Snippet: {story.get('snippet', '')}")
     context_parts.append(f"URL: {story.get('url', '')}")
 
-    # App context
-    context_parts.append(f"\nAPP: {app}")
-    context_parts.append(f"Keywords: {', '.join(app_keywords)}")
-
-    # Zep context (existing coverage)
-    if zep_context.get("articles"):
-        context_parts.append(f"\nEXISTING COVERAGE IN ZEP ({len(zep_context['articles'])} articles):")
-        for article in zep_context["articles"][:5]:
-            context_parts.append(f"- {article.get('title', '')}")
-
-    # Neon context (recently published)
-    if neon_recent:
-        context_parts.append(f"\nRECENTLY PUBLISHED ({len(neon_recent)} articles):")
-        for article in neon_recent[:5]:
-            context_parts.append(f"- {article.get('title', '')} ({article.get('published_at', '')})")
-
-    # Related entities from Zep
-    if zep_context.get("companies"):
-        context_parts.append(f"\nKNOWN COMPANIES: {', '.join([c.get('name', '') for c in zep_context['companies'][:10]])}")
-
-    if zep_context.get("deals"):
-        context_parts.append(f"\nKNOWN DEALS: {', '.join([d.get('name', '') for d in zep_context['deals'][:10]])}")
+    # App, coverage and entity context
+    context_parts.extend(_app_context_lines(app, app_keywords, zep_context, neon_recent))
 
     prompt = "\n".join(context_parts)
 
@@ -199,43 +254,57 @@ async def assess_news_batch(
     """
     activity.logger.info(f"Assessing {len(stories)} stories for app: {app}")
 
-    relevant_stories = []
-    skipped_stories = []
-
-    high_priority = 0
-    medium_priority = 0
-    low_priority = 0
-
+    assessments = []
     for story in stories:
-        assessment = await assess_story_relevance(
+        assessments.append(await assess_story_relevance(
             story=story,
             app=app,
             app_keywords=app_keywords,
             zep_context=zep_context,
             neon_recent=neon_recent
-        )
+        ))
+
+    return _tally_assessments(app, len(stories), assessments, min_relevance_score)
+
+
+def _tally_assessments(
+    app: str,
+    stories_assessed: int,
+    assessments: List[Dict[str, Any]],
+    min_relevance_score: float
+) -> Dict[str, Any]:
+    """
+    Split assessments into relevant/skipped and count priorities.
+
+    Relevant stories get an int priority_rank (Priority value) so the
+    workflow ranks them without string lookups.
+    """
+    relevant_stories = []
+    skipped_stories = []
+
+    priority_counts = [0] * len(Priority)
 
+    for assessment in assessments:
         if assessment.get("is_relevant") and assessment.get("relevance_score", 0) >= min_relevance_score:
+            rank = int(_PRIORITY_BY_NAME.get(assessment.get("priority"), Priority.LOW))
+            assessment["priority_rank"] = rank
+            priority_counts[rank] += 1
             relevant_stories.append(assessment)
-
-            priority = assessment.get("priority", "low")
-            if priority == "high":
-                high_priority += 1
-            elif priority == "medium":
-                medium_priority += 1
-            else:
-                low_priority += 1
         else:
             skipped_stories.append(assessment)
 
+    high_priority = priority_counts[Priority.HIGH]
+    medium_priority = priority_counts[Priority.MEDIUM]
+    low_priority = priority_counts[Priority.LOW]
+
     activity.logger.info(
-        f"Assessment complete: {len(relevant_stories)} relevant, "
+        f"Assessment complete for {app}: {len(relevant_stories)} relevant, "
         f"{len(skipped_stories)} skipped "
         f"(high={high_priority}, medium={medium_priority}, low={low_priority})"
     )
 
     return {
-        "stories_assessed": len(stories),
+        "stories_assessed": stories_assessed,
         "relevant_stories": relevant_stories,
         "skipped_stories": skipped_stories,
         "app": app,
@@ -284,7 +353,8 @@ async def get_recent_articles_from_neon(
 
                 await cur.execute(
                     """
-                    SELECT id, title, slug, article_type, published_at
+                    SELECT id, title, slug, article_type, published_at,
+                           payload->>'source_url'
                     FROM articles
                     WHERE app = %s
                     AND published_at >= %s
@@ -303,7 +373,8 @@ async def get_recent_articles_from_neon(
                         "title": row[1],
                         "slug": row[2],
                         "article_type": row[3],
-                        "published_at": row[4].isoformat() if row[4] else None
+                        "published_at": row[4].isoformat() if row[4] else None,
+                        "url": row[5]
                     })
 
                 activity.logger.info(f"Found {len(articles)} recent articles")
@@ -312,3 +383,349 @@ async def get_recent_articles_from_neon(
     except Exception as e:
         activity.logger.error(f"Failed to fetch recent articles: {str(e)}")
         return []
+
+
+# ============================================================================
+# FUSED CONTEXT FETCH + ASSESSMENT
+# ============================================================================
+
+def _normalize_title(title: Optional[str]) -> str:
+    """Case/whitespace-insensitive title key for duplicate detection."""
+    return " ".join((title or "").lower().split())
+
+
+def _filter_seen_stories(
+    stories: List[Dict[str, Any]],
+    zep_context: Dict[str, Any],
+    neon_recent: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Drop stories we already cover (Neon recent or Zep articles).
+
+    Matches on the source URL articles were created from (stored by
+    ArticleCreationWorkflow in the Neon payload and the Zep entity) and on
+    normalized title, using only data already fetched - no extra I/O.
+
+    Args:
+        stories: Serper news stories
+        zep_context: Zep context with "articles"
+        neon_recent: Recently published Neon articles
+
+    Returns:
+        Stories not yet covered, in original order
+    """
+    zep_articles = zep_context.get("articles", [])
+
+    seen_titles = {_normalize_title(a.get("title")) for a in neon_recent}
+    seen_titles.update(_normalize_title(a.get("title")) for a in zep_articles)
+    seen_titles.discard("")
+
+    seen_urls = {
+        (a.get("attributes") or {}).get("url")
+        for a in zep_articles
+    }
+    seen_urls.update(a.get("url") for a in neon_recent)
+    seen_urls.discard(None)
+
+    return [
+        s for s in stories
+        if s.get("url") not in seen_urls
+        and _normalize_title(s.get("title")) not in seen_titles
+    ]
+
+
+# Cheap pre-scorer (BM25 over title + snippet) - runs before the LLM
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+_WORD_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset({"a", "an", "and", "in", "of", "or", "the"})
+PRIORITY_SOURCE_BONUS = 0.2
+
+
+def _prefilter_stories(
+    stories: List[Dict[str, Any]],
+    app: str,
+    app_keywords: List[str],
+    min_score: float
+) -> List[Dict[str, Any]]:
+    """
+    Drop obvious noise before LLM assessment.
+
+    Stories that classify_topic routes to a different app are dropped
+    first. The rest are scored on title + snippet with BM25 against the
+    app keywords, normalized to the best story in the batch (0-1), plus a
+    bonus for the app's priority sources. If nothing overlaps the keywords
+    at all the batch is kept as-is (no signal to judge by).
+
+    Args:
+        stories: News stories
+        app: App name
+        app_keywords: Keywords for this app
+        min_score: Minimum normalized score to keep a story
+
+    Returns:
+        Stories scoring at least min_score, in original order
+    """
+    try:
+        app_config = get_app_config(app)
+    except ValueError:
+        app_config = None
+
+    # Stories whose keywords route them to another app are left to that
+    # app's monitor; unrouted stories (no keyword hits) stay in
+    if app_config:
+        stories = [
+            s for s in stories
+            if classify_topic(f"{s.get('title', '')} {s.get('snippet', '')}")[0] in (None, app)
+        ]
+
+    if not stories:
+        return stories
+
+    terms = set(_WORD_RE.findall(" ".join(app_keywords).lower())) - _STOPWORDS
+    docs = [
+        _WORD_RE.findall(f"{s.get('title', '')} {s.get('snippet', '')}".lower())
+        for s in stories
+    ]
+
+    n = len(docs)
+    avgdl = sum(map(len, docs)) / n or 1.0
+    df = Counter(t for doc in docs for t in set(doc) if t in terms)
+    idf = {t: math.log(1 + (n - df[t] + 0.5) / (df[t] + 0.5)) for t in df}
+
+    scores = []
+    for doc in docs:
+        tf = Counter(t for t in doc if t in idf)
+        norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * len(doc) / avgdl)
+        scores.append(sum(
+            idf[t] * f * (_BM25_K1 + 1) / (f + norm) for t, f in tf.items()
+        ))
+
+    top = max(scores)
+    if top <= 0:
+        return stories
+
+    kept = []
+    for story, score in zip(stories, scores):
+        score /= top
+        if app_config and app_config.is_priority_source(story.get("source", "")):
+            score += PRIORITY_SOURCE_BONUS
+        if score >= min_score:
+            kept.append(story)
+    return kept
+
+
+@activity.defn
+async def fetch_context_and_assess(
+    story_keys: List[str],
+    app: str,
+    app_keywords: List[str],
+    query: str,
+    min_relevance_score: float = 0.6,
+    min_prefilter_score: float = 0.2,
+    inline_stories: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Fetch Zep + Neon context and assess stories in one activity.
+
+    Stories arrive as blob keys and the context stays in-process, so none
+    of these payloads round-trip through workflow history.
+
+    Args:
+        story_keys: Blob keys of news story lists (from serper_single_page_news)
+        app: App name
+        app_keywords: Keywords for this app
+        query: Query used for the Zep context search
+        min_relevance_score: Minimum score to be considered relevant
+        min_prefilter_score: Minimum pre-scorer score to reach the LLM
+        inline_stories: Stories that couldn't be stored as blobs
+
+    Returns:
+        assess_news_batch result plus pre-filter and context counts
+    """
+    activity.logger.info(f"Fetching context and assessing {len(story_keys)} story pages for app: {app}")
+
+    candidates, zep_context, neon_recent, counts = await _prepare_candidates(
+        story_keys, app, app_keywords, query, min_prefilter_score, inline_stories
+    )
+
+    result = await assess_news_batch(
+        candidates,
+        app,
+        app_keywords,
+        zep_context,
+        neon_recent,
+        min_relevance_score
+    )
+    result.update(counts)
+    return result
+
+
+async def _prepare_candidates(
+    story_keys: List[str],
+    app: str,
+    app_keywords: List[str],
+    query: str,
+    min_prefilter_score: float,
+    inline_stories: Optional[List[Dict[str, Any]]] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Load one app's stories and context, then dedupe and pre-score them.
+
+    Returns:
+        (candidates, zep_context, recent articles newest-first, counts)
+    """
+    story_pages, zep_context, neon_recent = await asyncio.gather(
+        load_blobs(story_keys),
+        get_zep_context_for_generation(query, "article", app),
+        get_recent_articles_from_neon(app, 7, 50)  # Last 7 days, max 50
+    )
+    stories = [story for page in story_pages if page for story in page]
+    stories.extend(inline_stories or [])
+
+    # Skip stories already covered so we don't pay the LLM to re-assess them
+    fresh_stories = _filter_seen_stories(stories, zep_context, neon_recent)
+
+    # Cheap keyword pre-scorer - only plausible stories reach the LLM
+    candidates = _prefilter_stories(fresh_stories, app, app_keywords, min_prefilter_score)
+
+    counts = {
+        "stories_pre_filtered": len(stories) - len(fresh_stories),
+        "prefilter_kept": len(candidates),
+        "prefilter_dropped": len(fresh_stories) - len(candidates),
+        "zep_articles_known": len(zep_context.get("articles", [])),
+        "zep_companies_known": len(zep_context.get("companies", [])),
+        "neon_recent_count": len(neon_recent),
+    }
+
+    # Rows arrive newest-first (ORDER BY published_at DESC); the prompt
+    # shows the freshest few and reports the full count
+    return candidates, zep_context, neon_recent, counts
+
+
+# ============================================================================
+# MULTI-APP ASSESSMENT
+# ============================================================================
+
+@activity.defn
+async def assess_news_batch_multi_app(
+    per_app_payloads: Dict[str, Dict[str, Any]],
+    min_relevance_score: float = 0.6,
+    min_prefilter_score: float = 0.2
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Assess every app's stories with a single LLM call.
+
+    Each app's stories are deduped and pre-scored as in
+    fetch_context_and_assess, then all candidates go into one prompt with a
+    numbered section per app. Falls back to per-app assess_news_batch if
+    the combined call fails.
+
+    Args:
+        per_app_payloads: {app: {"story_keys", "inline_stories", "keywords", "query"}},
+            optionally with per-app "min_relevance_score"/"min_prefilter_score"
+        min_relevance_score: Default minimum score to be considered relevant
+        min_prefilter_score: Default minimum pre-scorer score to reach the LLM
+
+    Returns:
+        {app: fetch_context_and_assess-shaped result}
+    """
+    apps = list(per_app_payloads)
+    activity.logger.info(f"Multi-app assessment for {len(apps)} apps: {', '.join(apps)}")
+
+    min_scores = {
+        app: payload.get("min_relevance_score", min_relevance_score)
+        for app, payload in per_app_payloads.items()
+    }
+
+    prepared = dict(zip(apps, await asyncio.gather(*(
+        _prepare_candidates(
+            payload["story_keys"],
+            app,
+            payload["keywords"],
+            payload["query"],
+            payload.get("min_prefilter_score", min_prefilter_score),
+            payload.get("inline_stories")
+        )
+        for app, payload in per_app_payloads.items()
+    ))))
+
+    results: Dict[str, Dict[str, Any]] = {}
+    if any(candidates for candidates, _, _, _ in prepared.values()):
+        try:
+            results = await _assess_multi_app(prepared, per_app_payloads, min_scores)
+        except Exception as e:
+            activity.logger.error(f"Multi-app assessment failed, assessing per app: {str(e)}")
+            for app, (candidates, zep_context, neon_recent, _) in prepared.items():
+                results[app] = await assess_news_batch(
+                    candidates,
+                    app,
+                    per_app_payloads[app]["keywords"],
+                    zep_context,
+                    neon_recent,
+                    min_scores[app]
+                )
+    else:
+        results = {app: _tally_assessments(app, 0, [], min_scores[app]) for app in apps}
+
+    for app, (_, _, _, counts) in prepared.items():
+        results[app].update(counts)
+    return results
+
+
+async def _assess_multi_app(
+    prepared: Dict[str, Tuple[List[Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]], Dict[str, int]]],
+    per_app_payloads: Dict[str, Dict[str, Any]],
+    min_scores: Dict[str, float]
+) -> Dict[str, Dict[str, Any]]:
+    """Run the combined prompt and map assessments back by (app, story_index)."""
+    context_parts = [
+        "Assess every numbered story below for the app whose section it appears in.",
+        "Return one assessment per story, with its app name and story number.",
+    ]
+
+    for app, (candidates, zep_context, neon_recent, _) in prepared.items():
+        if not candidates:
+            continue
+        context_parts.append(f"\n{'=' * 40}")
+        context_parts.extend(
+            _app_context_lines(app, per_app_payloads[app]["keywords"], zep_context, neon_recent)
+        )
+        context_parts.append(f"\nSTORIES FOR {app}:")
+        for index, story in enumerate(candidates, 1):
+            context_parts.append(
+                f"{index}. {story.get('title', '')} | {story.get('source', '')} | "
+                f"{story.get('date', '')} | {story.get('snippet', '')}"
+            )
+
+    agent = get_multi_app_assessment_agent()
+    result = await agent.run("\n".join(context_parts))
+
+    by_story = {
+        (assessment.app, assessment.story_index): assessment
+        for assessment in result.data.assessments
+    }
+
+    results = {}
+    for app, (candidates, _, _, _) in prepared.items():
+        assessments = []
+        for index, story in enumerate(candidates, 1):
+            assessment = by_story.get((app, index))
+            if assessment is None:
+                # Unassessed stories are treated as skipped, not retried
+                assessments.append({
+                    "is_relevant": False,
+                    "relevance_score": 0.0,
+                    "story_type": "new",
+                    "priority": "low",
+                    "reasoning": "Not assessed in multi-app batch",
+                    "story": story
+                })
+                continue
+            assessments.append({
+                **assessment.model_dump(exclude={"app", "story_index"}),
+                "story": story
+            })
+        results[app] = _tally_assessments(app, len(candidates), assessments, min_scores[app])
+
+    return results
@@ -11,6 +11,7 @@ from temporalio import activity
 import httpx
 
 from config import config
+from ..storage.neon import store_blob
 
 
 # ============================================================================
@@ -43,6 +44,112 @@ async def _serper_request(
 # MULTI-PAGE NEWS SEARCH
 # ============================================================================
 
+async def _fetch_news_page(
+    query: str,
+    page_num: int,
+    results_per_page: int,
+    location: Optional[str],
+    time_period: str
+) -> List[Dict[str, Any]]:
+    """Fetch and normalize a single page of Serper news results."""
+    payload = {
+        "q": query,
+        "type": "news",
+        "num": results_per_page,
+        "page": page_num
+    }
+
+    # Add location if specified
+    if location:
+        payload["gl"] = "us" if "united states" in location.lower() else "gb"
+
+    # Add time filter
+    if time_period:
+        payload["tbs"] = f"qdr:{time_period}"
+
+    # Make request
+    result = await _serper_request("news", payload)
+
+    # Extract articles
+    news_items = result.get("news", [])
+
+    activity.logger.info(f"Page {page_num}: {len(news_items)} results")
+
+    return [
+        {
+            "url": item.get("link", ""),
+            "title": item.get("title", ""),
+            "snippet": item.get("snippet", ""),
+            "source": item.get("source", ""),
+            "date": item.get("date", ""),
+            "page": page_num,
+            "position": item.get("position", 0)
+        }
+        for item in news_items
+    ]
+
+
+@activity.defn
+async def serper_single_page_news(
+    query: str,
+    page: int = 1,
+    results_per_page: int = 10,
+    location: Optional[str] = None,
+    time_period: str = "y",  # y=year, m=month, w=week, d=day
+    as_blob: bool = False
+) -> Dict[str, Any]:
+    """
+    Search one page of news with Serper.
+
+    Lets workflows fetch several pages as concurrent activities instead of
+    one sequential serper_multi_page_news call. With as_blob, articles are
+    stored out of band and only their key is returned (keeps them out of
+    workflow history); if storing fails they are returned inline instead.
+
+    Args:
+        query: Search query
+        page: Page number (1-based)
+        results_per_page: Results per page (default 10)
+        location: Geographic location (e.g., "United States", "United Kingdom")
+        time_period: Time filter (y/m/w/d)
+        as_blob: Return articles_key instead of articles/urls when possible
+
+    Returns:
+        Results for the page with metadata
+    """
+    activity.logger.info(f"Serper single-page search: '{query}' (page {page})")
+
+    try:
+        articles = await _fetch_news_page(query, page, results_per_page, location, time_period)
+        cost = 0.001  # $0.001 per request
+    except Exception as e:
+        activity.logger.error(f"Serper page {page} failed: {str(e)}")
+        articles = []
+        cost = 0.0
+
+    if as_blob and articles:
+        try:
+            return {
+                "articles_key": await store_blob(articles),
+                "total_results": len(articles),
+                "page": page,
+                "query": query,
+                "cost": cost
+            }
+        except Exception as e:
+            # Blob store unavailable - fall back to inline articles
+            activity.logger.warning(f"Blob store failed for page {page}, returning inline: {str(e)}")
+
+    return {
+        "articles": articles,
+        "urls": [article["url"] for article in articles if article.get("url")],
+        "total_results": len(articles),
+        "page": page,
+        "query": query,
+        "cost": cost
+    }
+
+
 @activity.defn
 async def serper_multi_page_news(
     query: str,
@@ -76,46 +183,13 @@ async def serper_multi_page_news(
 
     for page_num in range(1, pages + 1):
         try:
-            # Calculate offset
-            start = (page_num - 1) * results_per_page
-
-            payload = {
-                "q": query,
-                "type": "news",
-                "num": results_per_page,
-                "page": page_num
-            }
-
-            # Add location if specified
-            if location:
-                payload["gl"] = "us" if "united states" in location.lower() else "gb"
-
-            # Add time filter
-            if time_period:
-                payload["tbs"] = f"qdr:{time_period}"
-
-            # Make request
-            result = await _serper_request("news", payload)
-
-            # Extract articles
-            news_items = result.get("news", [])
-
-            for item in news_items:
-                all_articles.append({
-                    "url": item.get("link", ""),
-                    "title": item.get("title", ""),
-                    "snippet": item.get("snippet", ""),
-                    "source": item.get("source", ""),
-                    "date": item.get("date", ""),
-                    "page": page_num,
-                    "position": item.get("position", 0)
-                })
+            all_articles.extend(
+                await _fetch_news_page(query, page_num, results_per_page, location, time_period)
+            )
 
             # Estimate cost ($0.001 per request)
             total_cost += 0.001
 
-            activity.logger.info(f"Page {page_num}: {len(news_items)} results")
-
         except Exception as e:
             activity.logger.error(f"Serper page {page_num} failed: {str(e)}")
             # Continue to next page
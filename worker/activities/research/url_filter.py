@@ -8,7 +8,11 @@ Filters and ranks URLs for optimal crawling:
 - Ranks by relevance score
 """
 
+import asyncio
+from collections import defaultdict
 from typing import List, Dict, Any
+from urllib.parse import urlsplit
+
 from temporalio import activity
 
 
@@ -122,12 +126,13 @@ async def smart_filter_urls(
     Returns:
         Filtered and ranked list of URLs (top N by score)
     """
-    activity.logger.info(f"Filtering {len(urls)} URLs (max: {max_urls})")
+    activity.logger.info("Filtering %d URLs (max: %d)", len(urls), max_urls)
 
     scored_urls = []
 
     for url in urls:
-        url_lower = url.lower()
+        # Most URLs are already lowercase - skip the copy when they are
+        url_lower = url if url.islower() else url.lower()
 
         # Skip paywalls
         if exclude_paywalls:
@@ -152,15 +157,15 @@ async def smart_filter_urls(
             score += 5
 
         # Deep article bonus (not homepage) (+3)
-        if url.count("/") > 4:
+        if url_lower.count("/") > 4:
             score += 3
 
         # HTTPS bonus (+1)
-        if url.startswith("https://"):
+        if url_lower.startswith("https://"):
             score += 1
 
         # Recent year in URL bonus (+2)
-        if any(year in url for year in ["2025", "2024", "2023"]):
+        if any(year in url_lower for year in ["2025", "2024", "2023"]):
             score += 2
 
         scored_urls.append((url, score))
@@ -172,13 +177,37 @@ async def smart_filter_urls(
     filtered = [url for url, score in scored_urls[:max_urls]]
 
     activity.logger.info(
-        f"Filtered to {len(filtered)} URLs "
-        f"(removed {len(urls) - len(filtered)} paywalls/social/low-relevance)"
+        "Filtered to %d URLs (removed %d paywalls/social/low-relevance)",
+        len(filtered), len(urls) - len(filtered)
     )
 
     return filtered
 
 
+async def _head_check(client, url: str) -> Dict[str, Any]:
+    """HEAD a single URL with an existing client."""
+    try:
+        response = await client.head(
+            url,
+            follow_redirects=True,
+            timeout=5.0
+        )
+
+        return {
+            "url": url,
+            "accessible": response.status_code < 400,
+            "status_code": response.status_code,
+            "final_url": str(response.url)
+        }
+
+    except Exception as e:
+        return {
+            "url": url,
+            "accessible": False,
+            "error": str(e)
+        }
+
+
 @activity.defn
 async def check_url_accessibility(url: str) -> Dict[str, Any]:
     """
@@ -192,24 +221,55 @@ async def check_url_accessibility(url: str) -> Dict[str, Any]:
     """
     import httpx
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.head(
-                url,
-                follow_redirects=True,
-                timeout=5.0
-            )
-
-            return {
-                "url": url,
-                "accessible": response.status_code < 400,
-                "status_code": response.status_code,
-                "final_url": str(response.url)
-            }
+    async with httpx.AsyncClient() as client:
+        return await _head_check(client, url)
 
-    except Exception as e:
-        return {
-            "url": url,
-            "accessible": False,
-            "error": str(e)
-        }
+
+@activity.defn
+async def check_urls_accessibility(urls: List[str]) -> List[Dict[str, Any]]:
+    """
+    Check many URLs at once, grouped by host.
+
+    Hosts are checked concurrently; URLs on the same host are checked
+    serially so they reuse one keep-alive connection (and TLS session).
+
+    Args:
+        urls: URLs to check
+
+    Returns:
+        Accessibility status per URL, in input order
+    """
+    import httpx
+
+    activity.logger.info("Checking accessibility of %d URLs", len(urls))
+
+    results: Dict[str, Dict[str, Any]] = {}
+
+    groups = defaultdict(list)
+    for url in urls:
+        try:
+            host = urlsplit(url).hostname
+        except ValueError as e:
+            # Malformed (e.g. bad IPv6 brackets) - can't be fetched anyway
+            results[url] = {"url": url, "accessible": False, "error": str(e)}
+            continue
+        groups[host].append(url)
+
+    async with httpx.AsyncClient() as client:
+        async def check_host(host_urls: List[str]) -> None:
+            for url in host_urls:
+                results[url] = await _head_check(client, url)
+
+        await asyncio.gather(*[check_host(us) for us in groups.values()])
+
+    return [results[url] for url in urls]
+
+
+# Statuses that mean the page is gone (others, like 403/405, often just
+# mean the site refuses HEAD and may still crawl fine)
+DEAD_STATUS_CODES = (404, 410)
+
+
+def is_dead_link(check: Dict[str, Any]) -> bool:
+    """True if an accessibility check shows the URL can't be crawled."""
+    return "error" in check or check.get("status_code") in DEAD_STATUS_CODES
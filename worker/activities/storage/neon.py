@@ -4,15 +4,24 @@ Neon Database Storage Activities
 Save companies and articles to Neon PostgreSQL database.
 """
 
-import json
 import uuid
-from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 import psycopg
+from psycopg.types.json import Jsonb, set_json_dumps
 from temporalio import activity
 
+try:
+    import orjson
+except ImportError:  # Fall back to psycopg default (stdlib json)
+    orjson = None
+
 from config import config
+from utils.url import slugify
+
+# Serialize JSONB payloads with orjson when available (psycopg accepts bytes)
+if orjson is not None:
+    set_json_dumps(orjson.dumps)
 
 
 # ============================================================================
@@ -66,6 +75,20 @@ CREATE INDEX IF NOT EXISTS idx_articles_created ON articles(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_articles_type ON articles(article_type);
 """
 
+# Large activity payloads (e.g. news stories) are parked here so workflow
+# history only records a key; rows older than BLOB_RETENTION are pruned
+BLOBS_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS activity_blobs (
+    key TEXT PRIMARY KEY,
+    data JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_activity_blobs_created ON activity_blobs(created_at);
+"""
+
+BLOB_RETENTION = "1 day"
+
 
 # ============================================================================
 # DATABASE INITIALIZATION
@@ -74,9 +97,10 @@ CREATE INDEX IF NOT EXISTS idx_articles_type ON articles(article_type);
 @activity.defn
 async def init_database_schema() -> Dict[str, Any]:
     """
-    Initialize database schema with companies and articles tables.
+    Initialize database schema with companies, articles and blob tables.
 
-    This should be run once during setup.
+    This should be run once during setup. If all tables already exist
+    the DDL is skipped entirely (one catalog probe instead of ~10).
 
     Returns:
         Dict with status and tables created
@@ -89,24 +113,35 @@ async def init_database_schema() -> Dict[str, Any]:
     try:
         async with await psycopg.AsyncConnection.connect(config.DATABASE_URL) as conn:
             async with conn.cursor() as cur:
-                # Create companies table
-                await cur.execute(COMPANIES_TABLE_SCHEMA)
-                activity.logger.info("Companies table created/verified")
-
-                # Create articles table
-                await cur.execute(ARTICLES_TABLE_SCHEMA)
-                activity.logger.info("Articles table created/verified")
+                # Probe catalog once - skip DDL when schema is already present
+                await cur.execute(
+                    "SELECT to_regclass('companies'), to_regclass('articles'), "
+                    "to_regclass('activity_blobs')"
+                )
+                if all(await cur.fetchone()):
+                    activity.logger.info("Database schema already present, skipping DDL")
+                    return {
+                        "status": "success",
+                        "tables_created": [],
+                        "already_initialized": True
+                    }
+
+                # Create all tables in a single round-trip
+                await cur.execute(
+                    COMPANIES_TABLE_SCHEMA + ARTICLES_TABLE_SCHEMA + BLOBS_TABLE_SCHEMA
+                )
+                activity.logger.info("Companies, articles and blob tables created/verified")
 
                 await conn.commit()
 
         activity.logger.info("Database schema initialized successfully")
         return {
             "status": "success",
-            "tables_created": ["companies", "articles"]
+            "tables_created": ["companies", "articles", "activity_blobs"]
         }
 
     except Exception as e:
-        activity.logger.error(f"Failed to initialize database: {str(e)}")
+        activity.logger.error("Failed to initialize database: %s", e)
         raise
 
 
@@ -129,7 +164,7 @@ async def save_company_to_neon(
     Returns:
         Dict with company_id, slug, status
     """
-    activity.logger.info(f"Saving company: {company_payload.get('name')}")
+    activity.logger.info("Saving company: %s", company_payload.get("name"))
 
     if not config.DATABASE_URL:
         raise ValueError("DATABASE_URL not configured")
@@ -139,7 +174,7 @@ async def save_company_to_neon(
 
     # Extract fields from payload
     name = company_payload.get("name", "Unknown")
-    slug = company_payload.get("slug", name.lower().replace(" ", "-"))
+    slug = company_payload.get("slug") or slugify(name)
     domain = company_payload.get("domain")
     category = company_payload.get("category", "general")
     app = company_payload.get("app", "placement")
@@ -185,7 +220,7 @@ async def save_company_to_neon(
                             name, domain, category, app, status,
                             description, website_url, logo_url,
                             featured_image_url, hero_image_url,
-                            json.dumps(company_payload), slug
+                            Jsonb(company_payload), slug
                         )
                     )
                     company_id = str((await cur.fetchone())[0])
@@ -208,7 +243,7 @@ async def save_company_to_neon(
                             company_id, slug, name, domain, category, app, status,
                             description, website_url, logo_url,
                             featured_image_url, hero_image_url,
-                            json.dumps(company_payload)
+                            Jsonb(company_payload)
                         )
                     )
                     company_id = str((await cur.fetchone())[0])
@@ -216,7 +251,7 @@ async def save_company_to_neon(
 
                 await conn.commit()
 
-        activity.logger.info(f"Company {operation}: {slug} (id: {company_id})")
+        activity.logger.info("Company %s: %s (id: %s)", operation, slug, company_id)
 
         return {
             "company_id": company_id,
@@ -227,7 +262,7 @@ async def save_company_to_neon(
         }
 
     except Exception as e:
-        activity.logger.error(f"Failed to save company: {str(e)}")
+        activity.logger.error("Failed to save company: %s", e)
         raise
 
 
@@ -246,7 +281,7 @@ async def get_company_from_neon(
     Returns:
         Company record or None
     """
-    activity.logger.info(f"Getting company by {by}: {identifier}")
+    activity.logger.info("Getting company by %s: %s", by, identifier)
 
     if not config.DATABASE_URL:
         raise ValueError("DATABASE_URL not configured")
@@ -291,7 +326,7 @@ async def get_company_from_neon(
                 return None
 
     except Exception as e:
-        activity.logger.error(f"Failed to get company: {str(e)}")
+        activity.logger.error("Failed to get company: %s", e)
         raise
 
 
@@ -316,19 +351,19 @@ async def save_article_to_neon(
     Args:
         article_payload: ArticlePayload as dict
         status: Article status (draft, published, archived)
-        publish: Whether to set published_at timestamp
+        publish: Whether to set published_at timestamp (database clock)
 
     Returns:
         Dict with article_id, slug, status
     """
-    activity.logger.info(f"Saving article: {article_payload.get('title')}")
+    activity.logger.info("Saving article: %s", article_payload.get("title"))
 
     if not config.DATABASE_URL:
         raise ValueError("DATABASE_URL not configured")
 
     # Extract fields from payload - map to Quest schema
     title = article_payload.get("title", "Untitled")
-    slug = article_payload.get("slug", title.lower().replace(" ", "-")[:100])
+    slug = article_payload.get("slug") or slugify(title, 100)
     content = article_payload.get("content", "")
     app = article_payload.get("app", "placement")
 
@@ -339,10 +374,9 @@ async def save_article_to_neon(
     meta_description = article_payload.get("meta_description", "")
     featured_image_url = article_payload.get("featured_image_url")
 
-    # Set published_at if publishing
-    published_at = None
-    if publish or status == "published":
-        published_at = datetime.utcnow()
+    # Set published_at if publishing (Postgres supplies the timestamp)
+    set_published = publish or status == "published"
+    if set_published:
         status = "published"
 
     try:
@@ -370,20 +404,22 @@ async def save_article_to_neon(
                             meta_description = %s,
                             featured_image_url = %s,
                             payload = %s,
-                            published_at = COALESCE(%s, published_at),
+                            published_at = CASE WHEN %s THEN NOW() ELSE published_at END,
                             updated_at = NOW()
                         WHERE slug = %s
-                        RETURNING id
+                        RETURNING id, published_at
                         """,
                         (
                             title, content, app, status,
                             excerpt, article_angle, word_count,
                             meta_description, featured_image_url,
-                            json.dumps(article_payload),
-                            published_at, slug
+                            Jsonb(article_payload),
+                            set_published, slug
                         )
                     )
-                    article_id = str((await cur.fetchone())[0])
+                    row = await cur.fetchone()
+                    article_id = str(row[0])
+                    published_at = row[1]
                     operation = "updated"
 
                 else:
@@ -396,23 +432,26 @@ async def save_article_to_neon(
                             meta_description, featured_image_url,
                             payload, published_at, created_at, updated_at
                         ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW()
+                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                            CASE WHEN %s THEN NOW() END, NOW(), NOW()
                         )
-                        RETURNING id
+                        RETURNING id, published_at
                         """,
                         (
                             slug, title, content, app, status,
                             excerpt, article_angle, word_count,
                             meta_description, featured_image_url,
-                            json.dumps(article_payload), published_at
+                            Jsonb(article_payload), set_published
                         )
                     )
-                    article_id = str((await cur.fetchone())[0])
+                    row = await cur.fetchone()
+                    article_id = str(row[0])
+                    published_at = row[1]
                     operation = "created"
 
                 await conn.commit()
 
-        activity.logger.info(f"Article {operation}: {slug} (id: {article_id})")
+        activity.logger.info("Article %s: %s (id: %s)", operation, slug, article_id)
 
         return {
             "article_id": article_id,
@@ -424,7 +463,7 @@ async def save_article_to_neon(
         }
 
     except Exception as e:
-        activity.logger.error(f"Failed to save article: {str(e)}")
+        activity.logger.error("Failed to save article: %s", e)
         raise
 
 
@@ -443,7 +482,7 @@ async def get_article_from_neon(
     Returns:
         Article record or None
     """
-    activity.logger.info(f"Getting article by {by}: {identifier}")
+    activity.logger.info("Getting article by %s: %s", by, identifier)
 
     if not config.DATABASE_URL:
         raise ValueError("DATABASE_URL not configured")
@@ -485,7 +524,7 @@ async def get_article_from_neon(
                 return None
 
     except Exception as e:
-        activity.logger.error(f"Failed to get article: {str(e)}")
+        activity.logger.error("Failed to get article: %s", e)
         raise
 
 
@@ -512,7 +551,7 @@ async def list_companies_from_neon(
     Returns:
         Dict with companies and total count
     """
-    activity.logger.info(f"Listing companies (app={app}, status={status})")
+    activity.logger.info("Listing companies (app=%s, status=%s)", app, status)
 
     if not config.DATABASE_URL:
         raise ValueError("DATABASE_URL not configured")
@@ -570,7 +609,7 @@ async def list_companies_from_neon(
                 }
 
     except Exception as e:
-        activity.logger.error(f"Failed to list companies: {str(e)}")
+        activity.logger.error("Failed to list companies: %s", e)
         raise
 
 
@@ -595,7 +634,7 @@ async def list_articles_from_neon(
     Returns:
         Dict with articles and total count
     """
-    activity.logger.info(f"Listing articles (app={app}, status={status}, type={article_type})")
+    activity.logger.info("Listing articles (app=%s, status=%s, type=%s)", app, status, article_type)
 
     if not config.DATABASE_URL:
         raise ValueError("DATABASE_URL not configured")
@@ -662,5 +701,68 @@ async def list_articles_from_neon(
                 }
 
     except Exception as e:
-        activity.logger.error(f"Failed to list articles: {str(e)}")
+        activity.logger.error("Failed to list articles: %s", e)
         raise
+
+
+# ============================================================================
+# BLOB STORAGE (keeps large payloads out of workflow history)
+# ============================================================================
+
+async def store_blob(data: Any) -> str:
+    """
+    Store a JSON payload and return its key.
+
+    Args:
+        data: JSON-serializable payload
+
+    Returns:
+        Opaque blob key
+    """
+    if not config.DATABASE_URL:
+        raise ValueError("DATABASE_URL not configured")
+
+    key = str(uuid.uuid4())
+
+    async with await psycopg.AsyncConnection.connect(config.DATABASE_URL) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                "INSERT INTO activity_blobs (key, data) VALUES (%s, %s)",
+                (key, Jsonb(data))
+            )
+            # Prune expired blobs opportunistically (indexed on created_at)
+            await cur.execute(
+                "DELETE FROM activity_blobs WHERE created_at < NOW() - %s::interval",
+                (BLOB_RETENTION,)
+            )
+
+        await conn.commit()
+
+    return key
+
+
+async def load_blobs(keys: List[str]) -> List[Any]:
+    """
+    Load payloads for several blob keys in one query.
+
+    Args:
+        keys: Blob keys from store_blob
+
+    Returns:
+        Payloads in key order (None for missing/expired keys)
+    """
+    if not keys:
+        return []
+
+    if not config.DATABASE_URL:
+        raise ValueError("DATABASE_URL not configured")
+
+    async with await psycopg.AsyncConnection.connect(config.DATABASE_URL) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                "SELECT key, data FROM activity_blobs WHERE key = ANY(%s)",
+                (list(keys),)
+            )
+            found = dict(await cur.fetchall())
+
+    return [found.get(key) for key in keys]
@@ -9,11 +9,31 @@ Zep-centric storage that handles:
 This is the BRAIN of Phoenix - all content flows through Zep.
 """
 
+import asyncio
+import io
 import os
-from typing import Dict, Any, List, Optional
+import re
+import time
+from collections import OrderedDict
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
 from temporalio import activity
 import httpx
 
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # Fall back to stdlib json
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
 from config import config
 
 
@@ -22,7 +42,7 @@ from config import config
 # ============================================================================
 
 class ZepClient:
-    """Client for Zep Cloud API."""
+    """Client for Zep Cloud API (holds a keep-alive connection pool)."""
 
     def __init__(self):
         self.api_key = config.ZEP_API_KEY
@@ -31,19 +51,346 @@ class ZepClient:
             "Authorization": f"Api-Key {self.api_key}",
             "Content-Type": "application/json"
         }
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
 
     async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make request to Zep API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method,
-                f"{self.base_url}{endpoint}",
-                headers=self.headers,
-                timeout=30.0,
-                **kwargs
-            )
-            response.raise_for_status()
-            return response.json() if response.text else {}
+        """Make request to Zep API (JSON bodies encoded/decoded with orjson)."""
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            kwargs["content"] = _json_dumps(payload)
+
+        response = await self._http.request(method, endpoint, **kwargs)
+        response.raise_for_status()
+        return _json_loads(response.content) if response.content else {}
+
+    async def graph_add_batch(
+        self,
+        nodes: List[Dict[str, Any]],
+        edges: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Create nodes and edges in a single request.
+
+        Nodes carry a "tmp_id"; edges reference them via source_tmp_id /
+        target_tmp_id so no UUIDs are needed up front.
+        """
+        return await self._request(
+            "POST",
+            "/v2/graph/batch",
+            json={"nodes": nodes, "edges": edges}
+        )
+
+    async def graph_add(self, data: str, group_id: str) -> Dict[str, Any]:
+        """Add a text episode to the graph (Zep's bulk ingestion path)."""
+        return await self._request(
+            "POST",
+            "/v2/graph",
+            json={"type": "text", "data": data, "group_id": group_id}
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+
+_zep_client: Optional[ZepClient] = None
+_zep_client_lock = asyncio.Lock()
+
+
+async def _get_zep_client() -> ZepClient:
+    """Get the shared ZepClient, creating it on first use."""
+    global _zep_client
+
+    if _zep_client is None:
+        async with _zep_client_lock:
+            if _zep_client is None:
+                _zep_client = ZepClient()
+
+    return _zep_client
+
+
+async def close_zep_client() -> None:
+    """Close the shared ZepClient (call on worker shutdown)."""
+    global _zep_client
+
+    if _zep_client is not None:
+        await _zep_client.aclose()
+        _zep_client = None
+
+
+# ============================================================================
+# SEARCH PAYLOAD TEMPLATES
+# ============================================================================
+
+# Constant parts of search bodies - only query/text (and limit) vary per call
+_MEMORY_SEARCH_BASE = {
+    "limit": 10,
+    "search_scope": "summary",
+    "search_type": "mmr"  # Maximal Marginal Relevance
+}
+_GRAPH_SEARCH_BASE = {"limit": 20, "scope": "nodes"}
+_NODE_TYPE_FILTERS = {
+    node_type: {"node_type": node_type}
+    for node_type in ("company", "article", "deal", "person")
+}
+
+
+# ============================================================================
+# BOUNDED FAN-OUT
+# ============================================================================
+
+# Cap in-flight Zep requests across the worker so fan-outs don't trip 429s
+_zep_semaphore = asyncio.Semaphore(config.ZEP_MAX_CONCURRENCY)
+
+
+async def _throttled(coro) -> Any:
+    """Await a coroutine while holding the Zep concurrency semaphore."""
+    async with _zep_semaphore:
+        return await coro
+
+
+async def _gather_throttled(coros: List[Any]) -> List[Any]:
+    """
+    Run coroutines concurrently under the Zep semaphore.
+
+    Like gather(return_exceptions=True): failures are returned in place.
+    Uses a TaskGroup where available so cancellation never leaks requests.
+    """
+    async def run(coro):
+        try:
+            return await _throttled(coro)
+        except Exception as e:
+            return e
+
+    if hasattr(asyncio, "TaskGroup"):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run(coro)) for coro in coros]
+        return [task.result() for task in tasks]
+
+    return await asyncio.gather(*[run(coro) for coro in coros])
+
+
+# Statuses meaning the batch graph endpoint isn't available on this Zep
+_BATCH_UNSUPPORTED_STATUSES = (404, 405, 501)
+_graph_batch_supported = True
+
+
+async def _create_graph_individually(
+    client: ZepClient,
+    entities: List[Tuple[str, Dict[str, Any]]],
+    planned_edges: List[Dict[str, Any]]
+) -> Tuple[Dict[str, str], List[Dict[str, Any]]]:
+    """
+    Fallback for graph_add_batch: one POST per node, then one per edge.
+
+    Args:
+        entities: (role tag, node) pairs - tags are the edges' tmp_ids
+
+    Returns:
+        (UUID by role tag for nodes that were created,
+         planned edges that were created)
+    """
+    # Create all entities in graph concurrently
+    node_results = await _gather_throttled([
+        client._request("POST", "/v2/graph/nodes", json=entity)
+        for _, entity in entities
+    ])
+
+    uuid_by_tag = {}
+    for (tag, entity), result in zip(entities, node_results):
+        if isinstance(result, Exception):
+            activity.logger.warning(f"Failed to create entity {entity['name']}: {result}")
+        elif result.get("uuid"):
+            uuid_by_tag[tag] = result["uuid"]
+
+    # Resolve role tags to the UUIDs just created
+    edge_coros = []
+    attempted_edges = []
+    for edge in planned_edges:
+        source_id = uuid_by_tag.get(edge["source_tmp_id"])
+        target_id = uuid_by_tag.get(edge["target_tmp_id"])
+
+        if source_id and target_id:
+            edge_coros.append(client._request(
+                "POST",
+                "/v2/graph/edges",
+                json={
+                    "source_node_uuid": source_id,
+                    "target_node_uuid": target_id,
+                    "type": edge["type"]
+                }
+            ))
+            attempted_edges.append(edge)
+
+    edge_results = await _gather_throttled(edge_coros)
+
+    created_edges = []
+    for edge, result in zip(attempted_edges, edge_results):
+        if isinstance(result, Exception):
+            activity.logger.warning(f"Failed to create relationship: {result}")
+        else:
+            created_edges.append(edge)
+
+    return uuid_by_tag, created_edges
+
+
+# ============================================================================
+# LOOKUP CACHE
+# ============================================================================
+
+class _TTLCache:
+    """Small LRU cache whose entries expire after ttl seconds."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: tuple, value: Dict[str, Any]) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: tuple) -> None:
+        self._data.pop(key, None)
+
+
+# Lookups are repeated for the same entities across workflows (e.g. a
+# news-monitoring batch) - cache successful results for a few minutes
+_zep_cache = _TTLCache(maxsize=1024, ttl=300.0)
+
+# Zep context search isn't app-scoped, so context entries are keyed without
+# the app and identical queries from different apps share one lookup
+_ANY_APP = ""
+
+
+def _cache_key(
+    kind: str,
+    entity_type: str,
+    entity_name: str,
+    domain: Optional[str],
+    app: str
+) -> tuple:
+    """Build a cache key for a Zep lookup."""
+    return (kind, entity_type, entity_name.lower(), domain or "", app)
+
+
+# Zep's per-message limit; longer narratives go through graph_add in chunks
+NARRATIVE_CHUNK_CHARS = 10_000
+
+
+def _chunk_narrative(text: str, max_chars: int = NARRATIVE_CHUNK_CHARS) -> List[str]:
+    """Split text into <= max_chars chunks on paragraph/section boundaries."""
+    chunks = []
+    buf = io.StringIO()
+
+    for block in text.split("\n\n"):
+        if buf.tell() and buf.tell() + len(block) + 2 > max_chars:
+            chunks.append(buf.getvalue())
+            buf = io.StringIO()
+
+        # Hard-split any single block that is itself too long
+        while len(block) > max_chars:
+            chunks.append(block[:max_chars])
+            block = block[max_chars:]
+
+        if block:
+            if buf.tell():
+                buf.write("\n\n")
+            buf.write(block)
+
+    if buf.tell():
+        chunks.append(buf.getvalue())
+
+    return chunks
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _canon(name: Optional[str]) -> str:
+    """Canonical form of an entity name for dedup."""
+    return _WHITESPACE_RE.sub(" ", (name or "").strip().lower())
+
+
+def _dedup_by_name(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse entities that share a canonical name.
+
+    Keeps first-seen order and the first spelling of the name; other
+    non-empty fields from later duplicates win. Nameless entities pass
+    through unmerged.
+    """
+    deduped: List[Dict[str, Any]] = []
+    by_key: Dict[str, Dict[str, Any]] = {}
+
+    for item in items:
+        key = _canon(item.get("name"))
+        if not key:
+            deduped.append(dict(item))
+        elif key in by_key:
+            by_key[key].update({k: v for k, v in item.items() if v and k != "name"})
+        else:
+            by_key[key] = dict(item)
+            deduped.append(by_key[key])
+
+    return deduped
+
+
+# Field extraction for extracted deals/people (defaults merged in first)
+_DEAL_DEFAULTS = {"name": "Unknown Deal", "amount": None, "date": None, "parties": [], "sector": None}
+_deal_fields = itemgetter("name", "amount", "date", "parties", "sector")
+_PERSON_DEFAULTS = {"name": "Unknown Person", "role": None, "company": None}
+_person_fields = itemgetter("name", "role", "company")
+
+
+def _pack_node(node: Dict[str, Any], name_key: str = "name") -> Dict[str, Any]:
+    """Extract the fields generation needs from a graph search node."""
+    return {
+        name_key: node.get("name"),
+        "uuid": node.get("uuid"),
+        "attributes": node.get("attributes", {})
+    }
+
+
+def _pack_edge_target(edge: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the target-node fields from a graph edge."""
+    return {
+        "name": edge.get("target_node_name"),
+        "attributes": edge.get("target_node_attributes", {}),
+        "relationship": edge.get("type")
+    }
+
+
+def _or_empty(result: Any, label: str) -> Dict[str, Any]:
+    """Unwrap a gather() result, logging and returning {} on failure."""
+    if isinstance(result, Exception):
+        activity.logger.warning(f"Zep {label} failed: {result}")
+        return {}
+    return result
 
 
 # ============================================================================
@@ -76,20 +423,24 @@ async def check_zep_for_existing(
     """
     activity.logger.info(f"Checking Zep for existing {entity_type}: {entity_name}")
 
+    cache_key = _cache_key("existing", entity_type, entity_name, domain, app)
+    cached = _zep_cache.get(cache_key)
+    if cached is not None:
+        activity.logger.info(f"Zep cache hit for {entity_type}: {entity_name}")
+        return cached
+
     try:
-        client = ZepClient()
+        client = await _get_zep_client()
 
         # Search for entity in graph
         search_results = await client._request(
             "POST",
             "/v2/graph/search",
             json={
+                **_GRAPH_SEARCH_BASE,
                 "query": entity_name,
                 "limit": 5,
-                "scope": "nodes",
-                "filters": {
-                    "node_type": entity_type
-                }
+                "filters": _NODE_TYPE_FILTERS.get(entity_type) or {"node_type": entity_type}
             }
         )
 
@@ -98,7 +449,7 @@ async def check_zep_for_existing(
 
         if not nodes:
             activity.logger.info(f"No existing {entity_type} found in Zep")
-            return {
+            result = {
                 "exists": False,
                 "entity_id": None,
                 "relationships": [],
@@ -106,6 +457,8 @@ async def check_zep_for_existing(
                 "people": [],
                 "related_companies": []
             }
+            _zep_cache.set(cache_key, result)
+            return result
 
         # Found existing entity
         entity = nodes[0]
@@ -121,39 +474,23 @@ async def check_zep_for_existing(
 
         edges = edges_response.get("edges", [])
 
-        # Categorize relationships
+        # Categorize relationships (table-driven by target node type)
         deals = []
         people = []
         related_companies = []
+        buckets = {"deal": deals, "person": people, "company": related_companies}
 
         for edge in edges:
-            target_type = edge.get("target_node_type", "")
-
-            if target_type == "deal":
-                deals.append({
-                    "name": edge.get("target_node_name"),
-                    "attributes": edge.get("target_node_attributes", {}),
-                    "relationship": edge.get("type")
-                })
-            elif target_type == "person":
-                people.append({
-                    "name": edge.get("target_node_name"),
-                    "attributes": edge.get("target_node_attributes", {}),
-                    "relationship": edge.get("type")
-                })
-            elif target_type == "company":
-                related_companies.append({
-                    "name": edge.get("target_node_name"),
-                    "attributes": edge.get("target_node_attributes", {}),
-                    "relationship": edge.get("type")
-                })
+            bucket = buckets.get(edge.get("target_node_type", ""))
+            if bucket is not None:
+                bucket.append(_pack_edge_target(edge))
 
         activity.logger.info(
             f"Zep context: {len(deals)} deals, {len(people)} people, "
             f"{len(related_companies)} related companies"
         )
 
-        return {
+        result = {
             "exists": True,
             "entity_id": entity_id,
             "entity_data": entity,
@@ -162,6 +499,8 @@ async def check_zep_for_existing(
             "people": people,
             "related_companies": related_companies
         }
+        _zep_cache.set(cache_key, result)
+        return result
 
     except Exception as e:
         activity.logger.error(f"Error checking Zep: {str(e)}")
@@ -206,76 +545,56 @@ async def get_zep_context_for_generation(
     """
     activity.logger.info(f"Getting Zep context for {entity_type}: {entity_name}")
 
-    try:
-        client = ZepClient()
-
-        # Memory search for related content
-        memory_results = await client._request(
-            "POST",
-            "/v2/memory/search",
-            json={
-                "text": entity_name,
-                "limit": 10,
-                "search_scope": "summary",
-                "search_type": "mmr"  # Maximal Marginal Relevance
-            }
-        )
-
-        memories = memory_results.get("results", [])
+    cache_key = _cache_key("context", entity_type, entity_name, None, _ANY_APP)
+    cached = _zep_cache.get(cache_key)
+    if cached is not None:
+        activity.logger.info(f"Zep cache hit for {entity_type}: {entity_name}")
+        return cached
 
-        # Graph search for entities
-        graph_results = await client._request(
-            "POST",
-            "/v2/graph/search",
-            json={
-                "query": entity_name,
-                "limit": 20,
-                "scope": "nodes"
-            }
-        )
-
-        nodes = graph_results.get("results", [])
-
-        # Categorize nodes
+    try:
+        client = await _get_zep_client()
+
+        # Memory search (related content) and graph search (entities)
+        # are independent - run them concurrently
+        memory_results, graph_results = await _gather_throttled([
+            client._request(
+                "POST",
+                "/v2/memory/search",
+                json={"text": entity_name, **_MEMORY_SEARCH_BASE}
+            ),
+            client._request(
+                "POST",
+                "/v2/graph/search",
+                json={"query": entity_name, **_GRAPH_SEARCH_BASE}
+            ),
+        ])
+
+        memories = _or_empty(memory_results, "memory search").get("results", [])
+        nodes = _or_empty(graph_results, "graph search").get("results", [])
+
+        # Categorize nodes (table-driven by node type; articles keyed by title)
         articles = []
         deals = []
         people = []
         companies = []
+        buckets = {
+            "article": (articles, "title"),
+            "deal": (deals, "name"),
+            "person": (people, "name"),
+            "company": (companies, "name"),
+        }
 
         for node in nodes:
-            node_type = node.get("type", "")
-
-            if node_type == "article":
-                articles.append({
-                    "title": node.get("name"),
-                    "uuid": node.get("uuid"),
-                    "attributes": node.get("attributes", {})
-                })
-            elif node_type == "deal":
-                deals.append({
-                    "name": node.get("name"),
-                    "uuid": node.get("uuid"),
-                    "attributes": node.get("attributes", {})
-                })
-            elif node_type == "person":
-                people.append({
-                    "name": node.get("name"),
-                    "uuid": node.get("uuid"),
-                    "attributes": node.get("attributes", {})
-                })
-            elif node_type == "company":
-                companies.append({
-                    "name": node.get("name"),
-                    "uuid": node.get("uuid"),
-                    "attributes": node.get("attributes", {})
-                })
+            bucket = buckets.get(node.get("type", ""))
+            if bucket is not None:
+                bucket[0].append(_pack_node(node, bucket[1]))
 
         activity.logger.info(
             f"Zep context retrieved: {len(memories)} memories, {len(articles)} articles, "
             f"{len(deals)} deals, {len(people)} people, {len(companies)} companies"
         )
 
-        return {
+        result = {
             "memories": memories,
             "articles": articles,
             "deals": deals,
@@ -283,6 +602,8 @@ async def get_zep_context_for_generation(
             "companies": companies,
             "total_context_items": len(memories) + len(nodes)
         }
+        _zep_cache.set(cache_key, result)
+        return result
 
     except Exception as e:
         activity.logger.error(f"Error getting Zep context: {str(e)}")
@@ -338,13 +659,15 @@ async def deposit_to_zep_hybrid(
     activity.logger.info(f"Depositing {entity_type} to Zep (hybrid): {entity_name}")
 
     try:
-        client = ZepClient()
+        client = await _get_zep_client()
 
         # ========== 1. NARRATIVE STORAGE ==========
         # Combine all sections into full narrative
         if entity_type == "company":
             sections = payload.get("profile_sections", {})
-            narrative_parts = [entity_name, "\n\n"]
+            buf = io.StringIO()
+            buf.write(entity_name)
+            buf.write("\n\n")
 
             for section_key, section_data in sections.items():
                 if isinstance(section_data, dict):
@@ -353,38 +676,62 @@ async def deposit_to_zep_hybrid(
                     content = str(section_data)
 
                 if content:
-                    narrative_parts.append(content)
-                    narrative_parts.append("\n\n")
+                    buf.write(content)
+                    buf.write("\n\n")
 
-            full_narrative = "".join(narrative_parts)
+            full_narrative = buf.getvalue()
         else:
             # Article
             full_narrative = f"{entity_name}\n\n{payload.get('content', '')}"
 
-        # Add to Zep memory for semantic search
         session_id = f"{entity_type}-{entity_id}"
+        truncated = len(full_narrative) > NARRATIVE_CHUNK_CHARS
 
+        # Add to Zep memory for semantic search (what check_zep_for_existing
+        # and get_zep_context_for_generation search). A narrative over the
+        # per-message limit is truncated here and ingested in full below
         await client._request(
             "POST",
             f"/v2/sessions/{session_id}/memory",
             json={
                 "messages": [{
                     "role": "system",
-                    "content": full_narrative,
+                    "content": full_narrative[:NARRATIVE_CHUNK_CHARS],
                     "metadata": {
                         "type": f"{entity_type}_profile",
                         "entity_id": entity_id,
                         "entity_name": entity_name,
                         "domain": domain,
-                        "app": app
+                        "app": app,
+                        "truncated": truncated
                     }
                 }]
             }
         )
 
+        chunks_failed = 0
+        if truncated:
+            # Full text to the graph in chunks, in addition to the memory
+            # message. Failed chunks are logged, not raised: a retry would
+            # re-add the chunks that already landed
+            chunks = _chunk_narrative(full_narrative)
+            chunk_results = await _gather_throttled([
+                client.graph_add(data=chunk, group_id=app)
+                for chunk in chunks
+            ])
+            for result in chunk_results:
+                if isinstance(result, Exception):
+                    chunks_failed += 1
+                    activity.logger.warning(f"Narrative chunk failed: {result}")
+            activity.logger.info(
+                f"Narrative ingested via graph_add: {len(chunks) - chunks_failed}/{len(chunks)} chunks"
+            )
+
         activity.logger.info(f"Narrative stored: {len(full_narrative)} chars")
 
         # ========== 2. ENTITY STORAGE ==========
+        # Each node is tagged with its role ("main", "deal:<i>", "person:<i>");
+        # the tag doubles as the tmp_id edges use to reference it
         entities_to_create = []
 
         # Main entity (company/article)
@@ -396,104 +743,134 @@ async def deposit_to_zep_hybrid(
                 "domain": domain,
                 "app": app,
                 "category": payload.get("category", ""),
+                "url": payload.get("source_url"),
             }
         }
-        entities_to_create.append(main_entity)
+        entities_to_create.append(("main", main_entity))
 
         # Extract deals
-        deals = extracted_entities.get("deals", [])
-        for deal in deals:
-            entities_to_create.append({
-                "name": deal.get("name", "Unknown Deal"),
+        deals = _dedup_by_name(extracted_entities.get("deals", []))
+        for i, deal in enumerate(deals):
+            name, amount, date, parties, sector = _deal_fields({**_DEAL_DEFAULTS, **deal})
+            entities_to_create.append((f"deal:{i}", {
+                "name": name,
                 "type": "deal",
                 "attributes": {
-                    "amount": deal.get("amount"),
-                    "date": deal.get("date"),
-                    "parties": deal.get("parties", []),
-                    "sector": deal.get("sector"),
+                    "amount": amount,
+                    "date": date,
+                    "parties": parties,
+                    "sector": sector,
                     "source_entity": entity_name
                 }
-            })
+            }))
 
         # Extract people
-        people = extracted_entities.get("people", [])
-        for person in people:
-            entities_to_create.append({
-                "name": person.get("name", "Unknown Person"),
+        people = _dedup_by_name(extracted_entities.get("people", []))
+        person_defaults = {**_PERSON_DEFAULTS, "company": entity_name}
+        for i, person in enumerate(people):
+            name, role, company = _person_fields({**person_defaults, **person})
+            entities_to_create.append((f"person:{i}", {
+                "name": name,
                 "type": "person",
                 "attributes": {
-                    "role": person.get("role"),
-                    "company": person.get("company", entity_name),
+                    "role": role,
+                    "company": company,
                     "source_entity": entity_name
                 }
+            }))
+
+        # Plan relationships up front, referencing nodes by role tag so the
+        # batch endpoint can resolve them without prior UUIDs
+        planned_edges = []
+
+        # Link people to company
+        for i, person in enumerate(people):
+            planned_edges.append({
+                "source_tmp_id": f"person:{i}",
+                "target_tmp_id": "main",
+                "type": "works_at"
+            })
+
+        # Link deals to company
+        for i, deal in enumerate(deals):
+            planned_edges.append({
+                "source_tmp_id": "main",
+                "target_tmp_id": f"deal:{i}",
+                "type": "advised_on"
             })
 
-        # Create all entities in graph
-        entity_ids = []
-        for entity in entities_to_create:
+        # ========== 3. GRAPH WRITE (batch, with per-item fallback) ==========
+        global _graph_batch_supported
+        batch_result = None
+
+        if _graph_batch_supported:
             try:
-                result = await client._request(
-                    "POST",
-                    "/v2/graph/nodes",
-                    json=entity
+                batch_result = await client.graph_add_batch(
+                    nodes=[{**entity, "tmp_id": tag} for tag, entity in entities_to_create],
+                    edges=planned_edges
                 )
-                entity_ids.append(result.get("uuid"))
-            except Exception as e:
-                activity.logger.warning(f"Failed to create entity {entity['name']}: {e}")
-                entity_ids.append(None)
-
-        activity.logger.info(f"Entities created: {len([e for e in entity_ids if e])}")
-
-        # ========== 3. RELATIONSHIP STORAGE ==========
-        main_entity_id = entity_ids[0] if entity_ids else None
-        relationships_created = 0
-
-        if main_entity_id:
-            # Link people to company
-            people_start_idx = 1 + len(deals)
-            for i, person in enumerate(people):
-                person_entity_id = entity_ids[people_start_idx + i] if people_start_idx + i < len(entity_ids) else None
-
-                if person_entity_id:
-                    try:
-                        await client._request(
-                            "POST",
-                            "/v2/graph/edges",
-                            json={
-                                "source_node_uuid": person_entity_id,
-                                "target_node_uuid": main_entity_id,
-                                "type": "works_at"
-                            }
-                        )
-                        relationships_created += 1
-                    except Exception as e:
-                        activity.logger.warning(f"Failed to create relationship: {e}")
-
-            # Link deals to company
-            for i, deal in enumerate(deals):
-                deal_entity_id = entity_ids[1 + i] if 1 + i < len(entity_ids) else None
-
-                if deal_entity_id:
-                    try:
-                        await client._request(
-                            "POST",
-                            "/v2/graph/edges",
-                            json={
-                                "source_node_uuid": main_entity_id,
-                                "target_node_uuid": deal_entity_id,
-                                "type": "advised_on"
-                            }
-                        )
-                        relationships_created += 1
-                    except Exception as e:
-                        activity.logger.warning(f"Failed to create relationship: {e}")
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in _BATCH_UNSUPPORTED_STATUSES:
+                    raise
+                activity.logger.info("Zep graph batch endpoint unsupported, using per-item writes")
+                _graph_batch_supported = False
+
+        if batch_result is not None:
+            uuid_by_tag = {
+                node.get("tmp_id"): node.get("uuid")
+                for node in batch_result.get("nodes", [])
+                if node.get("uuid")
+            }
+            relationships_created = len(batch_result.get("edges", []))
+            # Only trust the plan as the edge list when every edge landed
+            created_edges = planned_edges if relationships_created == len(planned_edges) else []
+        else:
+            uuid_by_tag, created_edges = await _create_graph_individually(
+                client, entities_to_create, planned_edges
+            )
+            relationships_created = len(created_edges)
 
+        main_entity_id = uuid_by_tag.get("main")
+
+        activity.logger.info(f"Entities created: {len(uuid_by_tag)}")
         activity.logger.info(f"Relationships created: {relationships_created}")
 
-        # ========== 4. FETCH GRAPH DATA ==========
+        # ========== 4. GRAPH DATA ==========
         graph_data = {"nodes": [], "edges": []}
 
-        if main_entity_id:
+        if main_entity_id and relationships_created == len(planned_edges):
+            # Every planned edge was created - assemble from what we know
+            # locally instead of re-fetching the edges we just wrote
+            node_by_tag = dict(entities_to_create)
+            graph_data["nodes"].append({"id": main_entity_id, "name": entity_name, "type": entity_type})
+
+            for edge in created_edges:
+                source_tag, target_tag = edge["source_tmp_id"], edge["target_tmp_id"]
+                other_tag = target_tag if source_tag == "main" else source_tag
+                other = node_by_tag[other_tag]
+
+                # The batch response may not echo every tmp_id - skip edges
+                # we can't map rather than failing a deposit Zep already has
+                source_uuid = uuid_by_tag.get(source_tag)
+                target_uuid = uuid_by_tag.get(target_tag)
+                if not (source_uuid and target_uuid):
+                    continue
+
+                graph_data["edges"].append({
+                    "source_node_uuid": source_uuid,
+                    "target_node_uuid": target_uuid,
+                    "target_node_name": node_by_tag[target_tag]["name"],
+                    "target_node_type": node_by_tag[target_tag]["type"],
+                    "type": edge["type"]
+                })
+                graph_data["nodes"].append({
+                    "id": uuid_by_tag[other_tag],
+                    "name": other["name"],
+                    "type": other["type"]
+                })
+
+        elif main_entity_id:
+            # Partial write - ask Zep what actually exists
             try:
                 # Get entity with edges for visualization
                 edges_response = await client._request(
@@ -519,16 +896,21 @@ async def deposit_to_zep_hybrid(
 
         activity.logger.info(
             f"Zep deposit complete: narrative={len(full_narrative)} chars, "
-            f"entities={len(entity_ids)}, relationships={relationships_created}"
+            f"entities={len(uuid_by_tag)}, relationships={relationships_created}"
         )
 
+        # Drop cached lookups so they don't mask what was just deposited
+        _zep_cache.delete(_cache_key("existing", entity_type, entity_name, domain, app))
+        _zep_cache.delete(_cache_key("context", entity_type, entity_name, None, _ANY_APP))
+
         return {
             "success": True,
             "session_id": session_id,
             "main_entity_id": main_entity_id,
-            "entities_created": len([e for e in entity_ids if e]),
+            "entities_created": len(uuid_by_tag),
             "relationships_created": relationships_created,
             "narrative_length": len(full_narrative),
+            "narrative_chunks_failed": chunks_failed,
             "graph_data": graph_data,
             "deals_count": len(deals),
             "people_count": len(people)
@@ -565,47 +947,52 @@ async def build_zep_context_prompt(zep_context: Dict[str, Any]) -> str:
     if not zep_context.get("exists", False) and zep_context.get("total_context_items", 0) == 0:
         return ""
 
-    parts = ["\n\nEXISTING KNOWLEDGE FROM ZEP GRAPH:\n"]
+    deals = zep_context.get("deals", [])
+    people = zep_context.get("people", [])
+    companies = zep_context.get("related_companies", []) or zep_context.get("companies", [])
+    articles = zep_context.get("articles", [])
+
+    # Nothing to say - skip the header too
+    if not any((deals, people, companies, articles)):
+        return ""
+
+    buf = io.StringIO()
+    buf.write("\n\nEXISTING KNOWLEDGE FROM ZEP GRAPH:\n")
 
     # Deals
-    deals = zep_context.get("deals", [])
     if deals:
-        parts.append(f"\nKnown Deals ({len(deals)}):\n")
-        for deal in deals[:10]:  # Limit to 10
+        buf.write(f"\nKnown Deals ({len(deals)}):\n")
+        for deal in islice(deals, 10):  # Limit to 10
             name = deal.get("name", "Unknown")
-            amount = deal.get("attributes", {}).get("amount", "undisclosed")
-            date = deal.get("attributes", {}).get("date", "")
-            parts.append(f"- {name}: {amount}")
+            attributes = deal.get("attributes") or {}
+            amount = attributes.get("amount", "undisclosed")
+            date = attributes.get("date", "")
+            buf.write(f"- {name}: {amount}")
             if date:
-                parts.append(f" ({date})")
-            parts.append("\n")
+                buf.write(f" ({date})")
+            buf.write("\n")
 
     # People
-    people = zep_context.get("people", [])
     if people:
-        parts.append(f"\nKnown People ({len(people)}):\n")
-        for person in people[:10]:
+        buf.write(f"\nKnown People ({len(people)}):\n")
+        for person in islice(people, 10):
             name = person.get("name", "Unknown")
-            role = person.get("attributes", {}).get("role", "")
-            parts.append(f"- {name}")
+            role = (person.get("attributes") or {}).get("role", "")
+            buf.write(f"- {name}")
             if role:
-                parts.append(f": {role}")
-            parts.append("\n")
+                buf.write(f": {role}")
+            buf.write("\n")
 
     # Related companies
-    companies = zep_context.get("related_companies", []) or zep_context.get("companies", [])
     if companies:
-        parts.append(f"\nRelated Companies ({len(companies)}):\n")
-        for company in companies[:10]:
-            name = company.get("name", "Unknown")
-            parts.append(f"- {name}\n")
+        buf.write(f"\nRelated Companies ({len(companies)}):\n")
+        for company in islice(companies, 10):
+            buf.write(f"- {company.get('name', 'Unknown')}\n")
 
     # Articles
-    articles = zep_context.get("articles", [])
     if articles:
-        parts.append(f"\nRelated Articles ({len(articles)}):\n")
-        for article in articles[:5]:
-            title = article.get("title", "Unknown")
-            parts.append(f"- {title}\n")
+        buf.write(f"\nRelated Articles ({len(articles)}):\n")
+        for article in islice(articles, 5):
+            buf.write(f"- {article.get('title', 'Unknown')}\n")
 
-    return "".join(parts)
+    return buf.getvalue()
@@ -5,10 +5,13 @@ Unified configuration for all Phoenix services.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional, List, Tuple
 from dotenv import load_dotenv
 
-load_dotenv()
+# Production containers get their environment injected - skip .env lookup
+if os.getenv("ENVIRONMENT") != "production":
+    load_dotenv()
 
 
 class Config:
@@ -51,6 +54,7 @@ class Config:
     # ========== KNOWLEDGE GRAPH ==========
     ZEP_API_KEY: Optional[str] = os.getenv("ZEP_API_KEY")
     ZEP_API_URL: str = os.getenv("ZEP_API_URL", "https://api.getzep.com")
+    ZEP_MAX_CONCURRENCY: int = int(os.getenv("ZEP_MAX_CONCURRENCY", "8"))
 
     @classmethod
     def get_ai_model(cls) -> Tuple[str, str]:
@@ -65,14 +69,7 @@ class Config:
         2. Google Gemini 2.5 Flash
         3. OpenAI GPT-4o Mini
         """
-        if cls.ANTHROPIC_API_KEY:
-            return ("anthropic", "claude-sonnet-4-5-20250929")
-        elif cls.GOOGLE_API_KEY:
-            return ("google", "gemini-2.5-flash")
-        elif cls.OPENAI_API_KEY:
-            return ("openai", "gpt-4o-mini")
-        else:
-            raise ValueError("No AI API key configured. Set ANTHROPIC_API_KEY, GOOGLE_API_KEY, or OPENAI_API_KEY")
+        return _ai_model()
 
     @classmethod
     def validate_required(cls) -> List[str]:
@@ -102,37 +99,62 @@ class Config:
             cls.OPENAI_API_KEY
         ])
 
+    # Service availability flags, computed on first as_dict() call
+    _SERVICE_FLAGS: Optional[dict] = None
+
     @classmethod
     def as_dict(cls) -> dict:
         """
         Get configuration as dictionary (for display).
 
         Returns:
-            Dictionary of service availability
+            Dictionary of service availability (a copy - safe to modify)
         """
-        return {
-            # Core
-            "has_temporal": bool(cls.TEMPORAL_API_KEY),
-            "has_database": bool(cls.DATABASE_URL),
-            "has_zep": bool(cls.ZEP_API_KEY),
-
-            # AI
-            "has_anthropic": bool(cls.ANTHROPIC_API_KEY),
-            "has_google": bool(cls.GOOGLE_API_KEY),
-            "has_openai": bool(cls.OPENAI_API_KEY),
-
-            # Research
-            "has_serper": bool(cls.SERPER_API_KEY),
-            "has_exa": bool(cls.EXA_API_KEY),
-            "has_firecrawl": bool(cls.FIRECRAWL_API_KEY),
-            "has_linkup": bool(cls.LINKUP_API_KEY),
-            "has_crawl_service": bool(cls.CRAWL_SERVICE_URL),
-
-            # Media
-            "has_cloudinary": bool(cls.CLOUDINARY_URL or cls.CLOUDINARY_API_KEY),
-            "has_flux": bool(cls.FLUX_API_KEY),
-            "has_replicate": bool(cls.REPLICATE_API_TOKEN),
-        }
+        if cls._SERVICE_FLAGS is None:
+            cls._SERVICE_FLAGS = {
+                # Core
+                "has_temporal": bool(cls.TEMPORAL_API_KEY),
+                "has_database": bool(cls.DATABASE_URL),
+                "has_zep": bool(cls.ZEP_API_KEY),
+
+                # AI
+                "has_anthropic": bool(cls.ANTHROPIC_API_KEY),
+                "has_google": bool(cls.GOOGLE_API_KEY),
+                "has_openai": bool(cls.OPENAI_API_KEY),
+
+                # Research
+                "has_serper": bool(cls.SERPER_API_KEY),
+                "has_exa": bool(cls.EXA_API_KEY),
+                "has_firecrawl": bool(cls.FIRECRAWL_API_KEY),
+                "has_linkup": bool(cls.LINKUP_API_KEY),
+                "has_crawl_service": bool(cls.CRAWL_SERVICE_URL),
+
+                # Media
+                "has_cloudinary": bool(cls.CLOUDINARY_URL or cls.CLOUDINARY_API_KEY),
+                "has_flux": bool(cls.FLUX_API_KEY),
+                "has_replicate": bool(cls.REPLICATE_API_TOKEN),
+            }
+
+        return dict(cls._SERVICE_FLAGS)
+
+    @classmethod
+    def reset_flags(cls) -> None:
+        """Clear cached service flags and AI model (e.g. after patching keys in tests)."""
+        cls._SERVICE_FLAGS = None
+        _ai_model.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _ai_model() -> Tuple[str, str]:
+    """Resolve the AI model once (API keys are fixed for the process)."""
+    if Config.ANTHROPIC_API_KEY:
+        return ("anthropic", "claude-sonnet-4-5-20250929")
+    elif Config.GOOGLE_API_KEY:
+        return ("google", "gemini-2.5-flash")
+    elif Config.OPENAI_API_KEY:
+        return ("openai", "gpt-4o-mini")
+    else:
+        raise ValueError("No AI API key configured. Set ANTHROPIC_API_KEY, GOOGLE_API_KEY, or OPENAI_API_KEY")
 
 
 # Singleton instance
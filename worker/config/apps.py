@@ -8,12 +8,18 @@ Each app has specific:
 - Target audience context
 """
 
-from typing import Dict, List, Any
-from pydantic import BaseModel
+import re
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator
 
 
 class AppConfig(BaseModel):
     """Configuration for a Phoenix app."""
+    # Immutable once built - configs are memoized and shared across workflows
+    model_config = ConfigDict(frozen=True)
+
     name: str
     display_name: str
     description: str
@@ -34,284 +40,396 @@ class AppConfig(BaseModel):
     # Geographic focus
     geographic_focus: List[str]
 
+    # Lowercased lookup set for membership tests (list kept for display)
+    _priority_sources_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+
+    @field_validator(
+        "keywords", "exclusions", "priority_sources",
+        "company_categories", "geographic_focus",
+        mode="after"
+    )
+    @classmethod
+    def _intern_strings(cls, values: List[str]) -> List[str]:
+        """Intern list entries so values shared across apps are one object."""
+        return [sys.intern(v) for v in values]
+
+    def model_post_init(self, __context: Any) -> None:
+        self._priority_sources_set = frozenset(sys.intern(s.lower()) for s in self.priority_sources)
+
+    def is_priority_source(self, source: str) -> bool:
+        """Check if a source is one of this app's priority sources."""
+        return source.lower() in self._priority_sources_set
+
 
 # ============================================================================
 # APP CONFIGURATIONS
 # ============================================================================
 
-PLACEMENT_CONFIG = AppConfig(
-    name="placement",
-    display_name="Placement Agent Directory",
-    description="Directory of placement agents for private equity fund managers",
-
-    keywords=[
-        "placement agent",
-        "fund placement",
-        "capital raising",
-        "private equity fundraising",
-        "LP commitment",
-        "fund distribution",
-        "GP stakes",
-        "fund formation",
-        "institutional investors",
-        "limited partner"
-    ],
-
-    exclusions=[
-        "job placement",
-        "staffing agency",
-        "recruitment",
-        "employment agency",
-        "real estate placement",
-        "product placement",
-        "advertising placement"
-    ],
-
-    priority_sources=[
-        "Private Equity International",
-        "PE Hub",
-        "PitchBook",
-        "Preqin",
-        "Buyouts Insider",
-        "Private Equity Wire",
-        "Institutional Investor",
-        "Bloomberg",
-        "Reuters"
-    ],
-
-    interests=[
-        "New fund launches",
-        "Placement agent mandates",
-        "LP commitments",
-        "Fundraising milestones",
-        "Team hires at placement agents",
-        "New placement agent launches",
-        "GP-LP relationships",
-        "Fund performance",
-        "Market trends in PE fundraising"
-    ],
-
-    target_audience="Private equity fund managers, GPs, institutional LPs, placement professionals",
-    content_tone="Professional, data-driven, industry insider",
-
-    company_categories=[
-        "placement_agent",
-        "fund_administrator",
-        "investor_relations",
-        "capital_advisory"
-    ],
-
-    geographic_focus=["US", "UK", "EU", "Asia"]
-)
-
-
-RELOCATION_CONFIG = AppConfig(
-    name="relocation",
-    display_name="Global Relocation Directory",
-    description="Directory of corporate relocation and global mobility providers",
-
-    keywords=[
-        "corporate relocation",
-        "employee mobility",
-        "global mobility",
-        "expat relocation",
-        "talent mobility",
-        "international assignment",
-        "relocation management",
-        "destination services",
-        "immigration services",
-        "assignment management"
-    ],
-
-    exclusions=[
-        "moving company reviews",
-        "DIY moving tips",
-        "furniture moving",
-        "residential moving",
-        "local moving",
-        "storage units",
-        "packing tips"
-    ],
-
-    priority_sources=[
-        "Mobility Magazine",
-        "Forum for Expatriate Management",
-        "Relocate Global",
-        "Re:locate Magazine",
-        "Global Mobility News",
-        "HR Executive",
-        "SHRM",
-        "Bloomberg",
-        "Reuters"
-    ],
-
-    interests=[
-        "RMC acquisitions and mergers",
-        "New mobility programs",
-        "Immigration policy changes",
-        "Remote work policies",
-        "Hybrid work impact on mobility",
-        "Tax and compliance changes",
-        "Technology in mobility",
-        "Sustainability in relocation",
-        "DE&I in global mobility"
-    ],
-
-    target_audience="HR leaders, global mobility managers, talent acquisition, relocation professionals",
-    content_tone="Practical, compliance-aware, HR-focused",
-
-    company_categories=[
-        "relocation_provider",
-        "destination_services",
-        "immigration_services",
-        "corporate_housing"
-    ],
-
-    geographic_focus=["US", "UK", "EU", "Asia", "Global"]
-)
-
-
-RAINMAKER_CONFIG = AppConfig(
-    name="rainmaker",
-    display_name="Rainmaker Network",
-    description="Network for dealmakers and business development professionals",
-
-    keywords=[
-        "rainmaker",
-        "dealmaker",
-        "investment banking",
-        "M&A advisor",
-        "deal origination",
-        "client acquisition",
-        "business development",
-        "deal sourcing",
-        "relationship capital",
-        "revenue generation"
-    ],
-
-    exclusions=[
-        "weather rainmaker",
-        "cloud seeding",
-        "irrigation",
-        "gaming rainmaker",
-        "music rainmaker"
-    ],
-
-    priority_sources=[
-        "Bloomberg",
-        "Reuters",
-        "Financial Times",
-        "Wall Street Journal",
-        "Dealogic",
-        "Mergermarket",
-        "PE Hub",
-        "Business Insider"
-    ],
-
-    interests=[
-        "Major deal announcements",
-        "Banker moves and hires",
-        "League table changes",
-        "New advisory mandates",
-        "Cross-border deals",
-        "Industry consolidation",
-        "New fund launches",
-        "IPO pipeline",
-        "SPAC activity"
-    ],
-
-    target_audience="Investment bankers, M&A advisors, PE deal teams, corporate development",
-    content_tone="Deal-focused, competitive intelligence, market-moving",
-
-    company_categories=[
-        "investment_bank",
-        "advisory_firm",
-        "boutique_bank",
-        "deal_origination"
-    ],
-
-    geographic_focus=["US", "UK", "EU", "Asia"]
-)
-
-
-CHIEF_OF_STAFF_CONFIG = AppConfig(
-    name="chief-of-staff",
-    display_name="Chief of Staff Network",
-    description="Community for Chiefs of Staff and executive operations professionals",
-
-    keywords=[
-        "chief of staff",
-        "executive operations",
-        "CEO office",
-        "strategic operations",
-        "executive assistant",
-        "office of the CEO",
-        "executive chief of staff",
-        "business operations",
-        "strategic initiatives"
-    ],
-
-    exclusions=[
-        "military chief of staff",
-        "White House chief of staff",
-        "government chief of staff",
-        "political appointments"
-    ],
-
-    priority_sources=[
-        "Harvard Business Review",
-        "McKinsey Insights",
-        "Fast Company",
-        "Forbes",
-        "Inc Magazine",
-        "Chief of Staff Network",
-        "LinkedIn News"
-    ],
-
-    interests=[
-        "CoS role evolution",
-        "Executive leadership",
-        "Organizational design",
-        "Strategic planning",
-        "Board relations",
-        "Executive communication",
-        "Crisis management",
-        "Change management",
-        "Career paths for CoS"
-    ],
-
-    target_audience="Chiefs of Staff, executive assistants, COOs, executive operations",
-    content_tone="Strategic, leadership-focused, career-oriented",
-
-    company_categories=[
-        "executive_services",
-        "consulting",
-        "leadership_development"
-    ],
-
-    geographic_focus=["US", "UK", "EU", "Global"]
-)
+def _build_placement_config() -> AppConfig:
+    return AppConfig(
+        name="placement",
+        display_name="Placement Agent Directory",
+        description="Directory of placement agents for private equity fund managers",
+
+        keywords=[
+            "placement agent",
+            "fund placement",
+            "capital raising",
+            "private equity fundraising",
+            "LP commitment",
+            "fund distribution",
+            "GP stakes",
+            "fund formation",
+            "institutional investors",
+            "limited partner"
+        ],
+
+        exclusions=[
+            "job placement",
+            "staffing agency",
+            "recruitment",
+            "employment agency",
+            "real estate placement",
+            "product placement",
+            "advertising placement"
+        ],
+
+        priority_sources=[
+            "Private Equity International",
+            "PE Hub",
+            "PitchBook",
+            "Preqin",
+            "Buyouts Insider",
+            "Private Equity Wire",
+            "Institutional Investor",
+            "Bloomberg",
+            "Reuters"
+        ],
+
+        interests=[
+            "New fund launches",
+            "Placement agent mandates",
+            "LP commitments",
+            "Fundraising milestones",
+            "Team hires at placement agents",
+            "New placement agent launches",
+            "GP-LP relationships",
+            "Fund performance",
+            "Market trends in PE fundraising"
+        ],
+
+        target_audience="Private equity fund managers, GPs, institutional LPs, placement professionals",
+        content_tone="Professional, data-driven, industry insider",
+
+        company_categories=[
+            "placement_agent",
+            "fund_administrator",
+            "investor_relations",
+            "capital_advisory"
+        ],
+
+        geographic_focus=["US", "UK", "EU", "Asia"]
+    )
+
+
+def _build_relocation_config() -> AppConfig:
+    return AppConfig(
+        name="relocation",
+        display_name="Global Relocation Directory",
+        description="Directory of corporate relocation and global mobility providers",
+
+        keywords=[
+            "corporate relocation",
+            "employee mobility",
+            "global mobility",
+            "expat relocation",
+            "talent mobility",
+            "international assignment",
+            "relocation management",
+            "destination services",
+            "immigration services",
+            "assignment management"
+        ],
+
+        exclusions=[
+            "moving company reviews",
+            "DIY moving tips",
+            "furniture moving",
+            "residential moving",
+            "local moving",
+            "storage units",
+            "packing tips"
+        ],
+
+        priority_sources=[
+            "Mobility Magazine",
+            "Forum for Expatriate Management",
+            "Relocate Global",
+            "Re:locate Magazine",
+            "Global Mobility News",
+            "HR Executive",
+            "SHRM",
+            "Bloomberg",
+            "Reuters"
+        ],
+
+        interests=[
+            "RMC acquisitions and mergers",
+            "New mobility programs",
+            "Immigration policy changes",
+            "Remote work policies",
+            "Hybrid work impact on mobility",
+            "Tax and compliance changes",
+            "Technology in mobility",
+            "Sustainability in relocation",
+            "DE&I in global mobility"
+        ],
+
+        target_audience="HR leaders, global mobility managers, talent acquisition, relocation professionals",
+        content_tone="Practical, compliance-aware, HR-focused",
+
+        company_categories=[
+            "relocation_provider",
+            "destination_services",
+            "immigration_services",
+            "corporate_housing"
+        ],
+
+        geographic_focus=["US", "UK", "EU", "Asia", "Global"]
+    )
+
+
+def _build_rainmaker_config() -> AppConfig:
+    return AppConfig(
+        name="rainmaker",
+        display_name="Rainmaker Network",
+        description="Network for dealmakers and business development professionals",
+
+        keywords=[
+            "rainmaker",
+            "dealmaker",
+            "investment banking",
+            "M&A advisor",
+            "deal origination",
+            "client acquisition",
+            "business development",
+            "deal sourcing",
+            "relationship capital",
+            "revenue generation"
+        ],
+
+        exclusions=[
+            "weather rainmaker",
+            "cloud seeding",
+            "irrigation",
+            "gaming rainmaker",
+            "music rainmaker"
+        ],
+
+        priority_sources=[
+            "Bloomberg",
+            "Reuters",
+            "Financial Times",
+            "Wall Street Journal",
+            "Dealogic",
+            "Mergermarket",
+            "PE Hub",
+            "Business Insider"
+        ],
+
+        interests=[
+            "Major deal announcements",
+            "Banker moves and hires",
+            "League table changes",
+            "New advisory mandates",
+            "Cross-border deals",
+            "Industry consolidation",
+            "New fund launches",
+            "IPO pipeline",
+            "SPAC activity"
+        ],
+
+        target_audience="Investment bankers, M&A advisors, PE deal teams, corporate development",
+        content_tone="Deal-focused, competitive intelligence, market-moving",
+
+        company_categories=[
+            "investment_bank",
+            "advisory_firm",
+            "boutique_bank",
+            "deal_origination"
+        ],
+
+        geographic_focus=["US", "UK", "EU", "Asia"]
+    )
+
+
+def _build_chief_of_staff_config() -> AppConfig:
+    return AppConfig(
+        name="chief-of-staff",
+        display_name="Chief of Staff Network",
+        description="Community for Chiefs of Staff and executive operations professionals",
+
+        keywords=[
+            "chief of staff",
+            "executive operations",
+            "CEO office",
+            "strategic operations",
+            "executive assistant",
+            "office of the CEO",
+            "executive chief of staff",
+            "business operations",
+            "strategic initiatives"
+        ],
+
+        exclusions=[
+            "military chief of staff",
+            "White House chief of staff",
+            "government chief of staff",
+            "political appointments"
+        ],
+
+        priority_sources=[
+            "Harvard Business Review",
+            "McKinsey Insights",
+            "Fast Company",
+            "Forbes",
+            "Inc Magazine",
+            "Chief of Staff Network",
+            "LinkedIn News"
+        ],
+
+        interests=[
+            "CoS role evolution",
+            "Executive leadership",
+            "Organizational design",
+            "Strategic planning",
+            "Board relations",
+            "Executive communication",
+            "Crisis management",
+            "Change management",
+            "Career paths for CoS"
+        ],
+
+        target_audience="Chiefs of Staff, executive assistants, COOs, executive operations",
+        content_tone="Strategic, leadership-focused, career-oriented",
+
+        company_categories=[
+            "executive_services",
+            "consulting",
+            "leadership_development"
+        ],
+
+        geographic_focus=["US", "UK", "EU", "Global"]
+    )
 
 
 # ============================================================================
 # APP REGISTRY
 # ============================================================================
 
-APP_CONFIGS: Dict[str, AppConfig] = {
-    "placement": PLACEMENT_CONFIG,
-    "relocation": RELOCATION_CONFIG,
-    "rainmaker": RAINMAKER_CONFIG,
-    "chief-of-staff": CHIEF_OF_STAFF_CONFIG,
+# Builders are only invoked on first lookup, so a worker serving one app
+# never materializes the others
+_APP_BUILDERS: Dict[str, Callable[[], AppConfig]] = {
+    "placement": _build_placement_config,
+    "relocation": _build_relocation_config,
+    "rainmaker": _build_rainmaker_config,
+    "chief-of-staff": _build_chief_of_staff_config,
 }
 
 
+@lru_cache(maxsize=None)
 def get_app_config(app_name: str) -> AppConfig:
-    """Get configuration for an app."""
-    if app_name not in APP_CONFIGS:
-        raise ValueError(f"Unknown app: {app_name}. Available: {list(APP_CONFIGS.keys())}")
-    return APP_CONFIGS[app_name]
+    """Get configuration for an app (built lazily, then memoized)."""
+    try:
+        builder = _APP_BUILDERS[app_name]
+    except KeyError:
+        raise ValueError(f"Unknown app: {app_name}. Available: {list(_APP_BUILDERS)}") from None
+    return builder()
 
 
 def get_all_apps() -> List[str]:
     """Get list of all configured apps."""
-    return list(APP_CONFIGS.keys())
+    return list(_APP_BUILDERS)
+
+
+# ============================================================================
+# TOPIC CLASSIFICATION
+# ============================================================================
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokens(text: str) -> List[str]:
+    """Lowercased word tokens, shared by the index build and lookups."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _add_phrases(
+    index: Dict[str, Tuple[str, ...]],
+    lengths: set,
+    app: str,
+    phrases: List[str]
+) -> None:
+    """Add an app's phrases to an inverted phrase -> apps index."""
+    for phrase in phrases:
+        tokens = _tokens(phrase)
+        if not tokens:
+            continue
+        key = " ".join(tokens)
+        if app not in index.get(key, ()):
+            index[key] = index.get(key, ()) + (app,)
+        lengths.add(len(tokens))
+
+
+@lru_cache(maxsize=None)
+def _phrase_index() -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, ...]], Tuple[int, ...]]:
+    """
+    Inverted indexes of normalized keyword/exclusion -> apps, built on first use.
+
+    Returns:
+        (keyword index, exclusion index, distinct phrase lengths in tokens)
+    """
+    keyword_index: Dict[str, Tuple[str, ...]] = {}
+    exclusion_index: Dict[str, Tuple[str, ...]] = {}
+    lengths: set = set()
+    for app in _APP_BUILDERS:
+        cfg = get_app_config(app)
+        _add_phrases(keyword_index, lengths, app, cfg.keywords)
+        _add_phrases(exclusion_index, lengths, app, cfg.exclusions)
+    return keyword_index, exclusion_index, tuple(sorted(lengths, reverse=True))
+
+
+def classify_topic(text: str) -> Tuple[Optional[str], List[str]]:
+    """
+    Work out which app a topic belongs to.
+
+    Slides a window for each phrase length over the text's tokens, so every
+    app's keywords and exclusions are matched with one dict probe per
+    position; apps with any exclusion hit are skipped.
+
+    Args:
+        text: Topic, headline or snippet
+
+    Returns:
+        (app with the most keyword hits or None, matched keywords)
+    """
+    keyword_index, exclusion_index, lengths = _phrase_index()
+    tokens = _tokens(text)
+    hits: Dict[str, List[str]] = {}
+    excluded = set()
+
+    for n in lengths:
+        for i in range(len(tokens) - n + 1):
+            phrase = " ".join(tokens[i:i + n])
+            for app in keyword_index.get(phrase, ()):
+                hits.setdefault(app, []).append(phrase)
+            excluded.update(exclusion_index.get(phrase, ()))
+
+    best_app = None
+    best_hits: List[str] = []
+    for app in _APP_BUILDERS:
+        app_hits = hits.get(app, [])
+        if app not in excluded and len(app_hits) > len(best_hits):
+            best_app, best_hits = app, app_hits
+
+    return best_app, best_hits
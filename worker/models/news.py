@@ -0,0 +1,16 @@
+"""
+News Monitoring Models
+
+Shared by the news assessment activities and the news monitor workflows,
+so it must stay free of activity-side dependencies.
+"""
+
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """Publishing priority as a sort rank (lower publishes first)."""
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+    UNRANKED = 3  # Assessments without a priority_rank sort last
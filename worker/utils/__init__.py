@@ -0,0 +1 @@
+"""Phoenix shared utilities."""
@@ -0,0 +1,55 @@
+"""
+URL Utilities
+
+Pure, memoized helpers for URL normalization. Safe to call from workflow
+code (deterministic, no I/O).
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+
+@lru_cache(maxsize=4096)
+def extract_domain_and_guess(url: str) -> Tuple[str, str]:
+    """
+    Extract the bare domain and a company name guess from a URL.
+
+    Cached so workflow replays and repeated ingests of the same domain
+    skip the parsing work.
+
+    Args:
+        url: Company website URL
+
+    Returns:
+        Tuple of (domain, company_name_guess)
+    """
+    # removeprefix only strips a leading "www." (no copy when absent);
+    # partition takes the first label in one pass without building a list
+    domain = urlparse(url).netloc.removeprefix("www.")
+    first_label = domain.partition(".")[0]
+    return domain, first_label.replace("-", " ").title()
+
+
+# Single-pass slug mapping: separators become "-", URL-unsafe chars are dropped
+_SLUG_TABLE = str.maketrans(
+    {
+        **{c: "-" for c in " /\\_"},
+        **{c: None for c in "?#&%'\".,:;!()[]{}<>|+=*@$^`~"},
+    }
+)
+
+
+def slugify(text: str, max_length: Optional[int] = None) -> str:
+    """
+    Build a URL-safe slug with one lower() and one translate() pass.
+
+    Args:
+        text: Name or title to slugify
+        max_length: Optional maximum slug length
+
+    Returns:
+        Slug string
+    """
+    slug = text.lower().translate(_SLUG_TABLE)
+    return slug[:max_length] if max_length else slug
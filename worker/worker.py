@@ -9,14 +9,17 @@ This is the heart of Phoenix - one worker, all workflows.
 """
 
 import asyncio
+import os
 import sys
+from typing import Any, Callable, Dict, List, Tuple
 
 from temporalio.client import Client
 from temporalio.worker import Worker
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (production gets them injected)
+if os.getenv("ENVIRONMENT") != "production":
+    load_dotenv()
 
 # Import configuration
 from config import config
@@ -24,11 +27,18 @@ from config import config
 # Import workflows
 from workflows.company_creation import CompanyCreationWorkflow
 from workflows.article_creation import ArticleCreationWorkflow
-from workflows.news_monitor import NewsMonitorWorkflow, NewsMonitorAllAppsWorkflow
+from workflows.news_monitor import (
+    NewsMonitorWorkflow,
+    NewsMonitorAllAppsWorkflow,
+    NewsMonitorAllAppsParallelWorkflow,
+    NewsMonitorBatcherWorkflow,
+    APP_NEWS_MONITOR_WORKFLOWS,
+)
 
 # Import all activities
 # Research
 from activities.research.serper import (
+    serper_single_page_news,
     serper_multi_page_news,
     serper_company_news,
     serper_topic_research,
@@ -36,6 +46,7 @@ from activities.research.serper import (
 from activities.research.url_filter import (
     smart_filter_urls,
     check_url_accessibility,
+    check_urls_accessibility,
 )
 from activities.research.crawl_fallback import (
     crawl4ai_service,
@@ -52,6 +63,8 @@ from activities.research.news_assessment import (
     assess_story_relevance,
     assess_news_batch,
     get_recent_articles_from_neon,
+    fetch_context_and_assess,
+    assess_news_batch_multi_app,
 )
 
 # Storage
@@ -60,6 +73,7 @@ from activities.storage.zep_hybrid import (
     get_zep_context_for_generation,
     deposit_to_zep_hybrid,
     build_zep_context_prompt,
+    close_zep_client,
 )
 from activities.storage.neon import (
     init_database_schema,
@@ -81,53 +95,149 @@ from activities.generation.article import (
 )
 
 
+# ============================================================================
+# REGISTRATION
+# ============================================================================
+
+WORKFLOWS_BY_TRIGGER: Dict[str, Tuple[Any, ...]] = {
+    "API triggered": (
+        CompanyCreationWorkflow,
+        ArticleCreationWorkflow,
+    ),
+    "Scheduled": (
+        NewsMonitorWorkflow,
+        NewsMonitorAllAppsWorkflow,
+        NewsMonitorAllAppsParallelWorkflow,
+        *APP_NEWS_MONITOR_WORKFLOWS.values(),
+    ),
+    "Signal-driven": (
+        NewsMonitorBatcherWorkflow,
+    ),
+}
+
+# Flattened for Worker registration; the trigger groups label the banner
+WORKFLOWS: Tuple[Any, ...] = tuple(
+    workflow for group in WORKFLOWS_BY_TRIGGER.values() for workflow in group
+)
+
+ACTIVITIES_BY_GROUP: Dict[str, Tuple[Callable[..., Any], ...]] = {
+    "Research - Serper": (
+        serper_single_page_news,
+        serper_multi_page_news,
+        serper_company_news,
+        serper_topic_research,
+    ),
+    "Research - URL Filter": (
+        smart_filter_urls,
+        check_url_accessibility,
+        check_urls_accessibility,
+    ),
+    "Research - Crawling": (
+        crawl4ai_service,
+        firecrawl_scrape,
+        linkup_fetch,
+        httpx_basic_crawl,
+        crawl_with_fallback,
+    ),
+    "Research - Deep": (
+        deep_research_company,
+        deep_research_article,
+    ),
+    "Research - News Assessment": (
+        assess_story_relevance,
+        assess_news_batch,
+        get_recent_articles_from_neon,
+        fetch_context_and_assess,
+        assess_news_batch_multi_app,
+    ),
+    "Storage - Zep": (
+        check_zep_for_existing,
+        get_zep_context_for_generation,
+        deposit_to_zep_hybrid,
+        build_zep_context_prompt,
+    ),
+    "Storage - Neon": (
+        init_database_schema,
+        save_company_to_neon,
+        get_company_from_neon,
+        save_article_to_neon,
+        get_article_from_neon,
+        list_companies_from_neon,
+        list_articles_from_neon,
+    ),
+    "Generation": (
+        generate_company_profile,
+        generate_article_content,
+        extract_entities_from_content,
+    ),
+    # TODO: Add these as they're built
+    # "Media": (generate_images, extract_logo),
+    # "Validation": (validate_urls,),
+}
+
+# Single source of truth for both Worker registration and the startup listing
+ACTIVITIES: Tuple[Callable[..., Any], ...] = tuple(
+    activity for group in ACTIVITIES_BY_GROUP.values() for activity in group
+)
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write a block of output lines with a single write + flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 async def main():
     """Start the Phoenix unified worker."""
 
-    print("=" * 70)
-    print("Phoenix Unified Worker - Starting...")
-    print("=" * 70)
-
-    # Display configuration
-    print("\nConfiguration:")
-    print(f"   Temporal Address: {config.TEMPORAL_ADDRESS}")
-    print(f"   Namespace: {config.TEMPORAL_NAMESPACE}")
-    print(f"   Task Queue: {config.TEMPORAL_TASK_QUEUE}")
-    print(f"   API Key: {'Set' if config.TEMPORAL_API_KEY else 'Not set'}")
-    print(f"   Environment: {config.ENVIRONMENT}")
+    # Startup output is buffered and written in one call per section
+    lines: List[str] = [
+        "=" * 70,
+        "Phoenix Unified Worker - Starting...",
+        "=" * 70,
+        "",
+        "Configuration:",
+        f"   Temporal Address: {config.TEMPORAL_ADDRESS}",
+        f"   Namespace: {config.TEMPORAL_NAMESPACE}",
+        f"   Task Queue: {config.TEMPORAL_TASK_QUEUE}",
+        f"   API Key: {'Set' if config.TEMPORAL_API_KEY else 'Not set'}",
+        f"   Environment: {config.ENVIRONMENT}",
+    ]
 
     # Validate required environment variables
     missing = config.validate_required()
 
     if missing:
-        print(f"\nMissing required environment variables:")
-        for var in missing:
-            print(f"   - {var}")
-        print("\n   Please set them in .env file or environment")
+        lines += ["", "Missing required environment variables:"]
+        lines += [f"   - {var}" for var in missing]
+        lines += ["", "   Please set them in .env file or environment"]
+        _write_lines(lines)
         sys.exit(1)
 
-    print("\nAll required environment variables present")
+    lines += ["", "All required environment variables present"]
 
     # Display service status
-    print("\nService Status:")
+    lines += ["", "Service Status:"]
     service_config = config.as_dict()
     for key, value in service_config.items():
         if key.startswith("has_"):
             service_name = key.replace("has_", "").upper()
             status = "YES" if value else "NO"
-            print(f"   {service_name}: {status}")
+            lines.append(f"   {service_name}: {status}")
 
     # Get AI model
     try:
         provider, model = config.get_ai_model()
-        print(f"\nAI Model: {provider} / {model}")
+        lines += ["", f"AI Model: {provider} / {model}"]
     except ValueError as e:
-        print(f"\nAI Error: {e}")
+        lines += ["", f"AI Error: {e}"]
+        _write_lines(lines)
         sys.exit(1)
 
-    # Connect to Temporal
-    print(f"\nConnecting to Temporal Cloud...")
+    lines += ["", "Connecting to Temporal Cloud..."]
+    _write_lines(lines)
 
+    # Connect to Temporal
     try:
         if config.TEMPORAL_API_KEY:
             # Temporal Cloud with TLS
@@ -154,134 +264,46 @@ async def main():
     worker = Worker(
         client,
         task_queue=config.TEMPORAL_TASK_QUEUE,
-        workflows=[
-            CompanyCreationWorkflow,
-            ArticleCreationWorkflow,
-            NewsMonitorWorkflow,
-            NewsMonitorAllAppsWorkflow,
-        ],
-        activities=[
-            # ========== RESEARCH ==========
-            # Serper
-            serper_multi_page_news,
-            serper_company_news,
-            serper_topic_research,
-
-            # URL Filtering
-            smart_filter_urls,
-            check_url_accessibility,
-
-            # Crawling
-            crawl4ai_service,
-            firecrawl_scrape,
-            linkup_fetch,
-            httpx_basic_crawl,
-            crawl_with_fallback,
-
-            # Deep Research
-            deep_research_company,
-            deep_research_article,
-
-            # News Assessment (Pydantic AI)
-            assess_story_relevance,
-            assess_news_batch,
-            get_recent_articles_from_neon,
-
-            # ========== STORAGE ==========
-            # Zep Hybrid
-            check_zep_for_existing,
-            get_zep_context_for_generation,
-            deposit_to_zep_hybrid,
-            build_zep_context_prompt,
-
-            # Neon Database
-            init_database_schema,
-            save_company_to_neon,
-            get_company_from_neon,
-            save_article_to_neon,
-            get_article_from_neon,
-            list_companies_from_neon,
-            list_articles_from_neon,
-
-            # ========== GENERATION ==========
-            generate_company_profile,
-            generate_article_content,
-            extract_entities_from_content,
-
-            # TODO: Add these as they're built
-            # Media
-            # generate_images,
-            # extract_logo,
-
-            # Validation
-            # validate_urls,
-        ],
+        workflows=WORKFLOWS,
+        activities=ACTIVITIES,
     )
 
-    print("\n" + "=" * 70)
-    print("Phoenix Unified Worker Started Successfully!")
-    print("=" * 70)
-    print(f"   Task Queue: {config.TEMPORAL_TASK_QUEUE}")
-    print(f"   Environment: {config.ENVIRONMENT}")
-    print("=" * 70)
-
-    print("\nRegistered Workflows:")
-    print("   - CompanyCreationWorkflow (API triggered)")
-    print("   - ArticleCreationWorkflow (API triggered)")
-    print("   - NewsMonitorWorkflow (Scheduled)")
-    print("   - NewsMonitorAllAppsWorkflow (Scheduled)")
-
-    print("\nRegistered Activities:")
-    activity_groups = [
-        ("Research - Serper", [
-            "serper_multi_page_news",
-            "serper_company_news",
-            "serper_topic_research",
-        ]),
-        ("Research - URL Filter", [
-            "smart_filter_urls",
-            "check_url_accessibility",
-        ]),
-        ("Research - Crawling", [
-            "crawl4ai_service",
-            "firecrawl_scrape",
-            "linkup_fetch",
-            "httpx_basic_crawl",
-            "crawl_with_fallback",
-        ]),
-        ("Research - Deep", [
-            "deep_research_company",
-            "deep_research_article",
-        ]),
-        ("Storage - Zep", [
-            "check_zep_for_existing",
-            "get_zep_context_for_generation",
-            "deposit_to_zep_hybrid",
-            "build_zep_context_prompt",
-        ]),
-        ("Storage - Neon", [
-            "save_company_to_neon",
-            "save_article_to_neon",
-            "list_companies_from_neon",
-            "list_articles_from_neon",
-        ]),
-        ("Generation", [
-            "generate_company_profile",
-            "generate_article_content",
-            "extract_entities_from_content",
-        ]),
+    workflow_lines: List[str] = [
+        f"   - {workflow.__name__} ({trigger})"
+        for trigger, workflows in WORKFLOWS_BY_TRIGGER.items()
+        for workflow in workflows
     ]
 
-    for group_name, activities in activity_groups:
-        print(f"\n   {group_name}:")
-        for activity in activities:
-            print(f"     - {activity}")
-
-    print("\nWorker is ready to process workflows")
-    print("   Press Ctrl+C to stop\n")
+    activity_lines: List[str] = []
+    for group_name, activities in ACTIVITIES_BY_GROUP.items():
+        activity_lines += ["", f"   {group_name}:"]
+        activity_lines += [f"     - {activity.__name__}" for activity in activities]
+
+    _write_lines([
+        "",
+        "=" * 70,
+        "Phoenix Unified Worker Started Successfully!",
+        "=" * 70,
+        f"   Task Queue: {config.TEMPORAL_TASK_QUEUE}",
+        f"   Environment: {config.ENVIRONMENT}",
+        "=" * 70,
+        "",
+        "Registered Workflows:",
+        *workflow_lines,
+        "",
+        "Registered Activities:",
+        *activity_lines,
+        "",
+        "Worker is ready to process workflows",
+        "   Press Ctrl+C to stop",
+        "",
+    ])
 
     # Run worker (blocks until interrupted)
-    await worker.run()
+    try:
+        await worker.run()
+    finally:
+        await close_zep_client()
 
 
 if __name__ == "__main__":
@@ -23,7 +23,15 @@ import asyncio
 from typing import Dict, Any
 
 with workflow.unsafe.imports_passed_through():
-    pass
+    from utils.url import slugify
+
+
+# Activity timeouts - built once and reused across runs and replays
+_TO_10S = timedelta(seconds=10)
+_TO_30S = timedelta(seconds=30)
+_TO_2M = timedelta(minutes=2)
+_TO_180S = timedelta(seconds=180)
+_TO_8M = timedelta(minutes=8)
 
 
 @workflow.defn
@@ -59,52 +67,65 @@ class ArticleCreationWorkflow:
         priority_sources = input_dict.get("priority_sources", [])
         exclude_paywalls = input_dict.get("exclude_paywalls", True)
 
-        # ===== PHASE 1: CHECK ZEP FIRST =====
-        workflow.logger.info("Phase 1: Checking Zep for existing article")
-
-        zep_existing = await workflow.execute_activity(
-            "check_zep_for_existing",
-            args=[topic, "article", None, app],
-            start_to_close_timeout=timedelta(seconds=30)
+        # ===== PHASES 1+2: CHECK ZEP FIRST + GET ZEP CONTEXT =====
+        # Independent Zep lookups - dispatch both activities concurrently
+        workflow.logger.info("Phases 1+2: Checking Zep for existing article and getting context")
+
+        zep_lookups = (
+            workflow.execute_activity(
+                "check_zep_for_existing",
+                args=[topic, "article", None, app],
+                start_to_close_timeout=_TO_30S
+            ),
+            workflow.execute_activity(
+                "get_zep_context_for_generation",
+                args=[topic, "article", app],
+                start_to_close_timeout=_TO_30S
+            )
         )
+        if workflow.patched("concurrent-zep-lookups"):
+            zep_existing, zep_context = await asyncio.gather(*zep_lookups)
+        else:
+            # Executions started before the change replay the lookups in order
+            zep_existing = await zep_lookups[0]
+            zep_context = await zep_lookups[1]
 
         if zep_existing.get("exists"):
             workflow.logger.info(f"Similar article exists in Zep: {zep_existing.get('entity_id')}")
 
-        # ===== PHASE 2: GET ZEP CONTEXT =====
-        workflow.logger.info("Phase 2: Getting Zep context for generation")
-
-        zep_context = await workflow.execute_activity(
-            "get_zep_context_for_generation",
-            args=[topic, "article", app],
-            start_to_close_timeout=timedelta(seconds=30)
-        )
-
         workflow.logger.info(
             f"Zep context: {zep_context.get('total_context_items', 0)} items"
         )
 
-        # Build context prompt
-        context_prompt = await workflow.execute_activity(
-            "build_zep_context_prompt",
-            args=[zep_context],
-            start_to_close_timeout=timedelta(seconds=10)
-        )
-
         # ===== PHASE 3: DEEP RESEARCH =====
+        # Research doesn't need the context prompt - build it alongside and
+        # join before Phase 4, its only consumer
         workflow.logger.info("Phase 3: Deep research (Serper pages 1-3 → Crawl4AI)")
 
-        research_data = await workflow.execute_activity(
-            "deep_research_article",
-            args=[
-                topic,
-                article_type,
-                max_sources,
-                priority_sources,
-                exclude_paywalls
-            ],
-            start_to_close_timeout=timedelta(minutes=8)
+        prompt_and_research = (
+            workflow.execute_activity(
+                "build_zep_context_prompt",
+                args=[zep_context],
+                start_to_close_timeout=_TO_10S
+            ),
+            workflow.execute_activity(
+                "deep_research_article",
+                args=[
+                    topic,
+                    article_type,
+                    max_sources,
+                    priority_sources,
+                    exclude_paywalls
+                ],
+                start_to_close_timeout=_TO_8M
+            )
         )
+        if workflow.patched("context-prompt-with-research"):
+            context_prompt, research_data = await asyncio.gather(*prompt_and_research)
+        else:
+            # Executions started before the change replay them in order
+            context_prompt = await prompt_and_research[0]
+            research_data = await prompt_and_research[1]
 
         workflow.logger.info(
             f"Research complete: {research_data.get('total_sources', 0)} sources, "
@@ -118,7 +139,7 @@ class ArticleCreationWorkflow:
         article = await workflow.execute_activity(
             "generate_article_content",
             args=[topic, article_type, research_data, context_prompt, app],
-            start_to_close_timeout=timedelta(seconds=180)
+            start_to_close_timeout=_TO_180S
         )
 
         workflow.logger.info(
@@ -126,16 +147,24 @@ class ArticleCreationWorkflow:
             f"completeness={article.get('data_completeness_score', 0):.2f}"
         )
 
-        slug = article.get("slug", topic.lower().replace(" ", "-")[:50])
+        slug = article.get("slug") or slugify(topic, 50)
+
+        # Keep the originating news URL (news monitor) with the article so
+        # Neon and Zep can recognise the story as covered
+        if input_dict.get("source_url"):
+            article["source_url"] = input_dict["source_url"]
 
         # ===== PHASE 5: EXTRACT ENTITIES =====
         workflow.logger.info("Phase 5: Extracting entities for Zep graph")
 
-        # Use entities from article generation
+        # Use entities from article generation (one lookup per key; None-safe)
+        deals = article.get("deals_mentioned") or ()
+        people = article.get("people_mentioned") or ()
+        companies = article.get("companies_mentioned") or ()
         extracted_entities = {
-            "deals": article.get("deals_mentioned", []),
-            "people": [{"name": p} for p in article.get("people_mentioned", [])],
-            "companies": [{"name": c} for c in article.get("companies_mentioned", [])]
+            "deals": list(deals),
+            "people": [{"name": p} for p in people],
+            "companies": [{"name": c} for c in companies]
         }
 
         workflow.logger.info(
@@ -159,7 +188,7 @@ class ArticleCreationWorkflow:
         db_result = await workflow.execute_activity(
             "save_article_to_neon",
             args=[article, "draft", False],
-            start_to_close_timeout=timedelta(seconds=30)
+            start_to_close_timeout=_TO_30S
         )
 
         article_id = db_result.get("article_id", "temp-article-" + slug)
@@ -182,7 +211,7 @@ class ArticleCreationWorkflow:
                 extracted_entities,
                 app
             ],
-            start_to_close_timeout=timedelta(minutes=2)
+            start_to_close_timeout=_TO_2M
         )
 
         workflow.logger.info(
@@ -24,7 +24,15 @@ from typing import Dict, Any
 
 # Import models (passed through)
 with workflow.unsafe.imports_passed_through():
-    pass
+    from utils.url import extract_domain_and_guess
+
+
+# Activity timeouts - built once and reused across runs and replays
+_TO_10S = timedelta(seconds=10)
+_TO_30S = timedelta(seconds=30)
+_TO_120S = timedelta(seconds=120)
+_TO_2M = timedelta(minutes=2)
+_TO_5M = timedelta(minutes=5)
 
 
 @workflow.defn
@@ -64,35 +72,37 @@ class CompanyCreationWorkflow:
         workflow.logger.info("Phase 1: Normalizing URL")
 
         # Extract domain and company name from URL
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        domain = parsed.netloc.replace("www.", "")
-        company_name_guess = domain.split(".")[0].replace("-", " ").title()
+        domain, company_name_guess = extract_domain_and_guess(url)
 
         workflow.logger.info(f"Domain: {domain}, Company guess: {company_name_guess}")
 
-        # ===== PHASE 2: CHECK ZEP FIRST =====
-        workflow.logger.info("Phase 2: Checking Zep for existing company")
-
-        zep_existing = await workflow.execute_activity(
-            "check_zep_for_existing",
-            args=[company_name_guess, "company", domain, app],
-            start_to_close_timeout=timedelta(seconds=30)
+        # ===== PHASES 2+3: CHECK ZEP FIRST + GET ZEP CONTEXT =====
+        # Independent Zep lookups - dispatch both activities concurrently
+        workflow.logger.info("Phases 2+3: Checking Zep for existing company and getting context")
+
+        zep_lookups = (
+            workflow.execute_activity(
+                "check_zep_for_existing",
+                args=[company_name_guess, "company", domain, app],
+                start_to_close_timeout=_TO_30S
+            ),
+            workflow.execute_activity(
+                "get_zep_context_for_generation",
+                args=[company_name_guess, "company", app],
+                start_to_close_timeout=_TO_30S
+            )
         )
+        if workflow.patched("concurrent-zep-lookups"):
+            zep_existing, zep_context = await asyncio.gather(*zep_lookups)
+        else:
+            # Executions started before the change replay the lookups in order
+            zep_existing = await zep_lookups[0]
+            zep_context = await zep_lookups[1]
 
         if zep_existing.get("exists") and not force_update:
             workflow.logger.info(f"Company exists in Zep: {zep_existing.get('entity_id')}")
             # Could return existing or continue to enrich
 
-        # ===== PHASE 3: GET ZEP CONTEXT =====
-        workflow.logger.info("Phase 3: Getting Zep context for generation")
-
-        zep_context = await workflow.execute_activity(
-            "get_zep_context_for_generation",
-            args=[company_name_guess, "company", app],
-            start_to_close_timeout=timedelta(seconds=30)
-        )
-
         workflow.logger.info(
             f"Zep context: {zep_context.get('total_context_items', 0)} items, "
             f"{len(zep_context.get('deals', []))} deals, "
@@ -103,7 +113,7 @@ class CompanyCreationWorkflow:
         context_prompt = await workflow.execute_activity(
             "build_zep_context_prompt",
             args=[zep_context],
-            start_to_close_timeout=timedelta(seconds=10)
+            start_to_close_timeout=_TO_10S
         )
 
         # ===== PHASE 4: DEEP RESEARCH =====
@@ -119,7 +129,7 @@ class CompanyCreationWorkflow:
                 max_crawl_urls,
                 use_exa
             ],
-            start_to_close_timeout=timedelta(minutes=5)
+            start_to_close_timeout=_TO_5M
         )
 
         workflow.logger.info(
@@ -134,7 +144,7 @@ class CompanyCreationWorkflow:
         profile = await workflow.execute_activity(
             "generate_company_profile",
             args=[research_data, context_prompt, app],
-            start_to_close_timeout=timedelta(seconds=120)
+            start_to_close_timeout=_TO_120S
         )
 
         workflow.logger.info(
@@ -172,7 +182,7 @@ class CompanyCreationWorkflow:
         db_result = await workflow.execute_activity(
             "save_company_to_neon",
             args=[profile, "draft"],
-            start_to_close_timeout=timedelta(seconds=30)
+            start_to_close_timeout=_TO_30S
         )
 
         company_id = db_result.get("company_id", "temp-id-" + domain)
@@ -195,7 +205,7 @@ class CompanyCreationWorkflow:
                 extracted_entities,
                 app
             ],
-            start_to_close_timeout=timedelta(minutes=2)
+            start_to_close_timeout=_TO_2M
         )
 
         workflow.logger.info(
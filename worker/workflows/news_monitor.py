@@ -16,14 +16,50 @@ Each app has its own scheduled instance:
 - placement: "placement agent", "fund placement", "capital raising"
 - relocation: "corporate relocation", "employee mobility", "global mobility"
 - rainmaker: "rainmaker", "dealmaker", "investment banking"
+
+Alternatively, NewsMonitorBatcherWorkflow takes per-app requests as signals
+and runs them in batches inside a single long-lived workflow. It and
+NewsMonitorAllAppsParallelWorkflow assess every app's stories in one
+multi-app LLM call.
 """
 
 from temporalio import workflow
 from datetime import timedelta
-from typing import Dict, Any, List
+import asyncio
+import heapq
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, Any, Awaitable, List, Tuple
 
 with workflow.unsafe.imports_passed_through():
-    pass
+    from models.news import Priority
+
+
+# Serper news pages fetched per run (one concurrent activity each)
+NEWS_PAGES = 2
+
+# Activity timeouts - built once and reused across runs and replays
+_TO_30S = timedelta(seconds=30)
+_TO_1M = timedelta(minutes=1)
+_TO_2M = timedelta(minutes=2)
+_TO_5M = timedelta(minutes=5)
+_TO_6M = timedelta(minutes=6)
+
+
+# Story ordering: priority rank in the high bits, inverted relevance
+# (1e-6 resolution, fits in 20 bits) in the low bits. priority_rank is the
+# int Priority value set by the assessment activity
+def _story_sort_key(assessment: Dict[str, Any]) -> int:
+    """Packed int sort key: high priority first, then highest relevance."""
+    rank = assessment.get("priority_rank", Priority.UNRANKED)
+    score = min(max(assessment.get("relevance_score") or 0.0, 0.0), 1.0)
+    return (rank << 20) | int((1.0 - score) * 1_000_000)
+
+
+async def _run_bounded(sem: asyncio.Semaphore, coro: Awaitable[Any]) -> Any:
+    """Await coro while holding a slot in sem (caps concurrent child workflows)."""
+    async with sem:
+        return await coro
 
 
 # ============================================================================
@@ -64,6 +100,493 @@ APP_KEYWORDS = {
     ]
 }
 
+# Serper/Zep query per app (top 3 keywords), built once at import
+APP_QUERIES = {
+    app: " OR ".join(kws[:3]) for app, kws in APP_KEYWORDS.items()
+}
+
+
+# ============================================================================
+# MONITORING PIPELINE
+# ============================================================================
+
+def _resolve_query(input_dict: Dict[str, Any], app: str, keywords: List[str]) -> str:
+    """Query for Serper/Zep: explicit, else precomputed per app, else top 3 keywords."""
+    query = input_dict.get("query")
+    if not query and "keywords" not in input_dict:
+        query = APP_QUERIES.get(app)
+    return query or " OR ".join(keywords[:3])
+
+
+async def _fetch_news(query: str) -> Tuple[List[str], List[Dict[str, Any]], int, float]:
+    """
+    Phase 1: fetch Serper news pages concurrently.
+
+    Stories are stored as blobs - history only records their keys. Pages
+    the blob store couldn't take come back inline.
+
+    Returns:
+        (story blob keys, inline stories, stories found, cost)
+    """
+    page_results = await asyncio.gather(*(
+        workflow.execute_activity(
+            "serper_single_page_news",
+            args=[query, page, 10, None, "d", True],  # 10 per page, last day, as blob
+            start_to_close_timeout=_TO_1M
+        )
+        for page in range(1, NEWS_PAGES + 1)
+    ))
+
+    story_keys = [page["articles_key"] for page in page_results if page.get("articles_key")]
+    inline_stories = [
+        story
+        for page in page_results if not page.get("articles_key")
+        for story in page.get("articles", [])
+    ]
+    stories_found = sum(page.get("total_results", 0) for page in page_results)
+    news_cost = sum(page.get("cost", 0.0) for page in page_results)
+    return story_keys, inline_stories, stories_found, news_cost
+
+
+def _rank_relevant(
+    relevant_stories: List[Dict[str, Any]],
+    top_k: int
+) -> Tuple[List[Dict[str, Any]], int, int, int]:
+    """
+    One pass over relevant stories: priority histogram + packed sort keys.
+
+    Returns:
+        (top_k stories best-first, high count, medium count, low count)
+    """
+    prio_counts: Counter = Counter()
+    keyed_stories = []
+    for story_assessment in relevant_stories:
+        prio_counts[story_assessment.get("priority_rank", Priority.UNRANKED)] += 1
+        keyed_stories.append((_story_sort_key(story_assessment), story_assessment))
+
+    # Select top_k by priority (high first) and relevance score - partial
+    # selection instead of sorting every relevant story
+    top_stories = heapq.nsmallest(top_k, keyed_stories, key=itemgetter(0))
+
+    high_count = prio_counts[Priority.HIGH]
+    medium_count = prio_counts[Priority.MEDIUM]
+    low_count = len(relevant_stories) - high_count - medium_count
+    return [story for _, story in top_stories], high_count, medium_count, low_count
+
+
+async def _create_articles(
+    app: str,
+    top_stories: List[Dict[str, Any]],
+    sem: asyncio.Semaphore
+) -> List[Dict[str, Any]]:
+    """
+    Phase 5: spawn ArticleCreationWorkflow children for top stories.
+
+    Article creations are independent and run concurrently, bounded by sem
+    so we don't flood the task queue or downstream APIs.
+
+    Returns:
+        Created articles, in priority order
+    """
+    # Build article inputs for top stories
+    article_inputs = []
+    for story_assessment in top_stories:
+        story = story_assessment.get("story", {})
+
+        workflow.logger.info(f"Creating article: {story.get('title', '')[:50]}...")
+
+        article_inputs.append({
+            "topic": story.get("title", ""),
+            "article_type": "news",
+            "app": app,
+            "research_depth": "standard",
+            "max_sources": 20,
+            "exclude_paywalls": True,
+            # Pass assessment context
+            "source_url": story.get("url"),
+            "story_type": story_assessment.get("story_type", "new"),
+            "suggested_angle": story_assessment.get("suggested_angle"),
+            "related_entities": story_assessment.get("related_entities", [])
+        })
+
+    task_queue = workflow.info().task_queue
+    child_runs = [
+        _run_bounded(sem, workflow.execute_child_workflow(
+            "ArticleCreationWorkflow",
+            article_input,
+            id=f"article-{app}-{workflow.uuid4().hex[:8]}",
+            task_queue=task_queue
+        ))
+        for article_input in article_inputs
+    ]
+    outcomes = await asyncio.gather(*child_runs, return_exceptions=True)
+
+    # Results keep priority order (gather preserves input order)
+    articles_created = []
+    for story_assessment, result in zip(top_stories, outcomes):
+        if isinstance(result, BaseException):
+            workflow.logger.error(f"Failed to create article: {str(result)}")
+            continue
+
+        story = story_assessment.get("story", {})
+        articles_created.append({
+            "title": story.get("title"),
+            "article_id": result.get("article_id"),
+            "slug": result.get("slug"),
+            "priority": story_assessment.get("priority"),
+            "story_type": story_assessment.get("story_type")
+        })
+
+        workflow.logger.info(f"Article created: {result.get('slug')}")
+
+    return articles_created
+
+
+def _no_stories_result(app: str) -> Dict[str, Any]:
+    """Summary for an app whose news fetch came back empty."""
+    return {
+        "app": app,
+        "stories_found": 0,
+        "stories_relevant": 0,
+        "articles_created": 0,
+        "message": "No news stories found for today"
+    }
+
+
+async def _finish_app(
+    app: str,
+    keywords: List[str],
+    stories_found: int,
+    news_cost: float,
+    assessment_result: Dict[str, Any],
+    auto_create: bool,
+    max_articles: int,
+    sem: asyncio.Semaphore
+) -> Dict[str, Any]:
+    """Rank assessed stories, run Phase 5 and build the per-app summary."""
+    pre_filtered = assessment_result.get("stories_pre_filtered", 0)
+
+    workflow.logger.info(
+        f"Context for {app}: {assessment_result.get('zep_articles_known', 0)} Zep articles, "
+        f"{assessment_result.get('zep_companies_known', 0)} known companies, "
+        f"{assessment_result.get('neon_recent_count', 0)} Neon articles in last 7 days; "
+        f"{pre_filtered} stories already covered"
+    )
+
+    relevant_stories = assessment_result.get("relevant_stories", [])
+    top_stories, high_count, medium_count, low_count = _rank_relevant(relevant_stories, max_articles)
+
+    workflow.logger.info(
+        f"Assessment complete for {app}: {len(relevant_stories)} relevant stories "
+        f"(high={high_count}, medium={medium_count}, low={low_count})"
+    )
+
+    # ===== PHASE 5: CREATE ARTICLES =====
+    articles_created = []
+
+    if auto_create and relevant_stories:
+        workflow.logger.info(f"Phase 5: Creating articles for top {max_articles} {app} stories")
+        articles_created = await _create_articles(app, top_stories, sem)
+
+    # ===== COMPLETE =====
+    workflow.logger.info(
+        f"News Monitor complete for {app}: "
+        f"{stories_found} found, {len(relevant_stories)} relevant, "
+        f"{len(articles_created)} created"
+    )
+
+    return {
+        "app": app,
+        "keywords": keywords,
+        "stories_found": stories_found,
+        "stories_pre_filtered": pre_filtered,
+        "prefilter_kept": assessment_result.get("prefilter_kept", 0),
+        "prefilter_dropped": assessment_result.get("prefilter_dropped", 0),
+        "stories_assessed": assessment_result.get("stories_assessed", 0),
+        "stories_relevant": len(relevant_stories),
+        "articles_created": len(articles_created),
+        "articles": articles_created,
+        "high_priority_count": high_count,
+        "medium_priority_count": medium_count,
+        "low_priority_count": low_count,
+        "cost": news_cost
+    }
+
+
+async def monitor_app_news(input_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the news monitoring pipeline for one app in the calling workflow.
+
+    Used by NewsMonitorWorkflow and its per-app subclasses (one app per
+    workflow); multi-app workflows use monitor_apps_news.
+
+    Args:
+        input_dict: NewsMonitorWorkflow input (see its run docstring)
+
+    Returns:
+        Summary of monitoring results
+    """
+    app = input_dict.get("app", "placement")
+    keywords = input_dict.get("keywords", APP_KEYWORDS.get(app, []))
+    min_relevance = input_dict.get("min_relevance_score", 0.7)
+
+    workflow.logger.info(f"News Monitor starting for app: {app}")
+    workflow.logger.info(f"Keywords: {keywords}")
+
+    # ===== PHASE 1: FETCH NEWS =====
+    workflow.logger.info("Phase 1: Fetching news from Serper")
+
+    query = _resolve_query(input_dict, app, keywords)
+    workflow.logger.info(f"Query: {query}")
+
+    story_keys, inline_stories, stories_found, news_cost = await _fetch_news(query)
+    workflow.logger.info(f"Found {stories_found} news stories")
+
+    if not stories_found:
+        return _no_stories_result(app)
+
+    # ===== PHASES 2-4: ZEP CONTEXT + NEON RECENT + AI ASSESSMENT =====
+    # One fused activity - context blobs never enter workflow history
+    workflow.logger.info("Phases 2-4: Fetching Zep/Neon context and assessing story relevance")
+
+    assessment_result = await workflow.execute_activity(
+        "fetch_context_and_assess",
+        args=[
+            story_keys,
+            app,
+            keywords,
+            query,
+            min_relevance,
+            input_dict.get("min_prefilter_score", 0.2),
+            inline_stories
+        ],
+        start_to_close_timeout=_TO_6M
+    )
+
+    return await _finish_app(
+        app,
+        keywords,
+        stories_found,
+        news_cost,
+        assessment_result,
+        input_dict.get("auto_create_articles", True),
+        input_dict.get("max_articles_to_create", 5),
+        asyncio.Semaphore(input_dict.get("max_concurrency", 3))
+    )
+
+
+async def _monitor_app_news_legacy(input_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Original sequential pipeline for one app.
+
+    Kept so NewsMonitorWorkflow executions started before the fused
+    pipeline replay the commands they recorded: serper_multi_page_news,
+    Zep context, Neon recent, assess_news_batch, then one article child
+    at a time. Remove once no such executions remain.
+    """
+    app = input_dict.get("app", "placement")
+    keywords = input_dict.get("keywords", APP_KEYWORDS.get(app, []))
+    min_relevance = input_dict.get("min_relevance_score", 0.7)
+    auto_create = input_dict.get("auto_create_articles", True)
+    max_articles = input_dict.get("max_articles_to_create", 5)
+
+    query = " OR ".join(keywords[:3])  # Use top 3 keywords
+
+    news_result = await workflow.execute_activity(
+        "serper_multi_page_news",
+        args=[query, 2, 10, None, "d"],  # 2 pages, 10 per page, last day
+        start_to_close_timeout=_TO_2M
+    )
+
+    stories = news_result.get("articles", [])
+    if not stories:
+        return _no_stories_result(app)
+
+    zep_context = await workflow.execute_activity(
+        "get_zep_context_for_generation",
+        args=[query, "article", app],
+        start_to_close_timeout=_TO_30S
+    )
+
+    neon_recent = await workflow.execute_activity(
+        "get_recent_articles_from_neon",
+        args=[app, 7, 50],  # Last 7 days, max 50
+        start_to_close_timeout=_TO_30S
+    )
+
+    assessment_result = await workflow.execute_activity(
+        "assess_news_batch",
+        args=[stories, app, keywords, zep_context, neon_recent, min_relevance],
+        start_to_close_timeout=_TO_5M
+    )
+
+    relevant_stories = assessment_result.get("relevant_stories", [])
+    articles_created = []
+
+    if auto_create and relevant_stories:
+        # Recorded results predate priority_rank - rank on the priority string
+        sorted_stories = sorted(
+            relevant_stories,
+            key=lambda x: (
+                0 if x.get("priority") == "high" else (1 if x.get("priority") == "medium" else 2),
+                -x.get("relevance_score", 0)
+            )
+        )
+
+        for story_assessment in sorted_stories[:max_articles]:
+            story = story_assessment.get("story", {})
+            try:
+                result = await workflow.execute_child_workflow(
+                    "ArticleCreationWorkflow",
+                    {
+                        "topic": story.get("title", ""),
+                        "article_type": "news",
+                        "app": app,
+                        "research_depth": "standard",
+                        "max_sources": 20,
+                        "exclude_paywalls": True,
+                        "source_url": story.get("url"),
+                        "story_type": story_assessment.get("story_type", "new"),
+                        "suggested_angle": story_assessment.get("suggested_angle"),
+                        "related_entities": story_assessment.get("related_entities", [])
+                    },
+                    id=f"article-{app}-{workflow.uuid4().hex[:8]}",
+                    task_queue=workflow.info().task_queue
+                )
+            except Exception as e:
+                workflow.logger.error(f"Failed to create article: {str(e)}")
+                continue
+
+            articles_created.append({
+                "title": story.get("title"),
+                "article_id": result.get("article_id"),
+                "slug": result.get("slug"),
+                "priority": story_assessment.get("priority"),
+                "story_type": story_assessment.get("story_type")
+            })
+
+    return {
+        "app": app,
+        "keywords": keywords,
+        "stories_found": len(stories),
+        "stories_assessed": assessment_result.get("stories_assessed", 0),
+        "stories_relevant": len(relevant_stories),
+        "articles_created": len(articles_created),
+        "articles": articles_created,
+        "high_priority_count": assessment_result.get("total_high_priority", 0),
+        "medium_priority_count": assessment_result.get("total_medium_priority", 0),
+        "low_priority_count": assessment_result.get("total_low_priority", 0),
+        "cost": news_result.get("cost", 0.0)
+    }
+
+
+async def monitor_apps_news(
+    requests: List[Dict[str, Any]],
+    sem: asyncio.Semaphore
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+    """
+    Run the news monitoring pipeline for several apps with one assessment.
+
+    News fetches fan out per app, then one assess_news_batch_multi_app
+    activity assesses every app's stories in a single LLM call, then
+    article creation fans out again under sem. Shared by
+    NewsMonitorAllAppsParallelWorkflow and NewsMonitorBatcherWorkflow.
+
+    Args:
+        requests: NewsMonitorWorkflow inputs, one per app (a later request
+            for the same app replaces an earlier one)
+        sem: Bounds article workflows in flight across all apps
+
+    Returns:
+        (per-app summaries in request order, per-app errors)
+    """
+    requests_by_app = {req.get("app", "placement"): req for req in requests}
+    apps = list(requests_by_app)
+    keywords = {
+        app: req.get("keywords", APP_KEYWORDS.get(app, []))
+        for app, req in requests_by_app.items()
+    }
+    queries = {
+        app: _resolve_query(req, app, keywords[app])
+        for app, req in requests_by_app.items()
+    }
+
+    # ===== PHASE 1: FETCH NEWS (all apps concurrently) =====
+    fetch_outcomes = await asyncio.gather(
+        *(_fetch_news(queries[app]) for app in apps),
+        return_exceptions=True
+    )
+
+    # Failures are data, not control flow - one app can't sink the run
+    errors = []
+    fetched = {}
+    for app, outcome in zip(apps, fetch_outcomes):
+        if isinstance(outcome, BaseException):
+            workflow.logger.error(f"News fetch failed for {app}: {str(outcome)}")
+            errors.append({"app": app, "error": str(outcome)})
+            continue
+        fetched[app] = outcome
+
+    payloads = {
+        app: {
+            "story_keys": story_keys,
+            "inline_stories": inline_stories,
+            "keywords": keywords[app],
+            "query": queries[app],
+            "min_relevance_score": requests_by_app[app].get("min_relevance_score", 0.7),
+            "min_prefilter_score": requests_by_app[app].get("min_prefilter_score", 0.2)
+        }
+        for app, (story_keys, inline_stories, stories_found, _) in fetched.items()
+        if stories_found
+    }
+
+    # ===== PHASES 2-4: CONTEXT + ONE MULTI-APP ASSESSMENT =====
+    assessments: Dict[str, Dict[str, Any]] = {}
+    if payloads:
+        workflow.logger.info(f"Phases 2-4: Assessing {list(payloads)} in one call")
+        try:
+            assessments = await workflow.execute_activity(
+                "assess_news_batch_multi_app",
+                args=[payloads],
+                start_to_close_timeout=_TO_6M
+            )
+        except Exception as e:
+            # Retries exhausted - every app in the call fails, the run goes on
+            workflow.logger.error(f"News assessment failed for {list(payloads)}: {str(e)}")
+            errors.extend({"app": app, "error": str(e)} for app in payloads)
+            payloads = {}
+
+    # ===== PHASE 5: CREATE ARTICLES (all apps, shared bound) =====
+    finished = await asyncio.gather(
+        *(_finish_app(
+            app,
+            payload["keywords"],
+            fetched[app][2],
+            fetched[app][3],
+            assessments.get(app, {}),
+            requests_by_app[app].get("auto_create_articles", True),
+            requests_by_app[app].get("max_articles_to_create", 5),
+            sem
+        ) for app, payload in payloads.items()),
+        return_exceptions=True
+    )
+
+    by_app = {}
+    for app, outcome in zip(payloads, finished):
+        if isinstance(outcome, BaseException):
+            workflow.logger.error(f"News Monitor failed for {app}: {str(outcome)}")
+            errors.append({"app": app, "error": str(outcome)})
+            continue
+        by_app[app] = outcome
+
+    failed_apps = {error["app"] for error in errors}
+    results = [
+        by_app.get(app) or _no_stories_result(app)
+        for app in apps
+        if app not in failed_apps
+    ]
+    return results, errors
+
 
 @workflow.defn
 class NewsMonitorWorkflow:
@@ -85,175 +608,99 @@ class NewsMonitorWorkflow:
             input_dict: {
                 "app": "placement",
                 "keywords": [...] (optional, uses defaults)
+                "query": "..." (optional, overrides the keyword query)
                 "min_relevance_score": 0.7,
+                "min_prefilter_score": 0.2 (cheap pre-scorer cut-off),
                 "auto_create_articles": True,
-                "max_articles_to_create": 5
+                "max_articles_to_create": 5,
+                "max_concurrency": 3 (max article workflows in flight)
             }
 
         Returns:
             Summary of monitoring results
         """
-        app = input_dict.get("app", "placement")
-        keywords = input_dict.get("keywords", APP_KEYWORDS.get(app, []))
-        min_relevance = input_dict.get("min_relevance_score", 0.7)
-        auto_create = input_dict.get("auto_create_articles", True)
-        max_articles = input_dict.get("max_articles_to_create", 5)
+        if not workflow.patched("fused-news-pipeline"):
+            return await _monitor_app_news_legacy(input_dict)
+        return await monitor_app_news(input_dict)
 
-        workflow.logger.info(f"News Monitor starting for app: {app}")
-        workflow.logger.info(f"Keywords: {keywords}")
 
-        # ===== PHASE 1: FETCH NEWS =====
-        workflow.logger.info("Phase 1: Fetching news from Serper")
-
-        # Build query from keywords
-        query = " OR ".join(keywords[:3])  # Use top 3 keywords
-
-        news_result = await workflow.execute_activity(
-            "serper_multi_page_news",
-            args=[query, 2, 10, None, "d"],  # 2 pages, 10 per page, last day
-            start_to_close_timeout=timedelta(minutes=2)
-        )
-
-        stories = news_result.get("articles", [])
-        workflow.logger.info(f"Found {len(stories)} news stories")
+class _AppNewsMonitorWorkflow(NewsMonitorWorkflow):
+    """
+    Base for NewsMonitorWorkflow subclasses with the app baked in.
 
-        if not stories:
-            return {
-                "app": app,
-                "stories_found": 0,
-                "stories_relevant": 0,
-                "articles_created": 0,
-                "message": "No news stories found for today"
-            }
+    Each scheduled per-app instance can then target its own workflow type
+    instead of routing on input. Subclasses set APP and define their own
+    @workflow.run (Temporal requires it on every workflow class).
+    """
 
-        # ===== PHASE 2: GET ZEP CONTEXT =====
-        workflow.logger.info("Phase 2: Getting Zep context for existing coverage")
+    APP: str = ""
 
-        zep_context = await workflow.execute_activity(
-            "get_zep_context_for_generation",
-            args=[query, "article", app],
-            start_to_close_timeout=timedelta(seconds=30)
-        )
+    def _app_input(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Pin the app; keywords and query default to this app's."""
+        keywords = input_dict.get("keywords")
+        return {
+            **input_dict,
+            "app": self.APP,
+            "keywords": keywords or APP_KEYWORDS[self.APP],
+            # Caller keywords build their own query (see _resolve_query)
+            "query": input_dict.get("query") or (None if keywords else APP_QUERIES[self.APP])
+        }
 
-        workflow.logger.info(
-            f"Zep context: {len(zep_context.get('articles', []))} existing articles, "
-            f"{len(zep_context.get('companies', []))} known companies"
-        )
 
-        # ===== PHASE 3: GET NEON RECENT =====
-        workflow.logger.info("Phase 3: Getting recently published from Neon")
+@workflow.defn
+class NewsMonitorPlacementWorkflow(_AppNewsMonitorWorkflow):
+    """News monitor for the placement app."""
 
-        neon_recent = await workflow.execute_activity(
-            "get_recent_articles_from_neon",
-            args=[app, 7, 50],  # Last 7 days, max 50
-            start_to_close_timeout=timedelta(seconds=30)
-        )
+    APP = "placement"
 
-        workflow.logger.info(f"Neon recent: {len(neon_recent)} articles in last 7 days")
+    @workflow.run
+    async def run(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return await super().run(self._app_input(input_dict))
 
-        # ===== PHASE 4: AI ASSESSMENT =====
-        workflow.logger.info("Phase 4: AI assessment of story relevance")
 
-        assessment_result = await workflow.execute_activity(
-            "assess_news_batch",
-            args=[
-                stories,
-                app,
-                keywords,
-                zep_context,
-                neon_recent,
-                min_relevance
-            ],
-            start_to_close_timeout=timedelta(minutes=5)
-        )
+@workflow.defn
+class NewsMonitorRelocationWorkflow(_AppNewsMonitorWorkflow):
+    """News monitor for the relocation app."""
 
-        relevant_stories = assessment_result.get("relevant_stories", [])
+    APP = "relocation"
 
-        workflow.logger.info(
-            f"Assessment complete: {len(relevant_stories)} relevant stories "
-            f"(high={assessment_result.get('total_high_priority', 0)}, "
-            f"medium={assessment_result.get('total_medium_priority', 0)}, "
-            f"low={assessment_result.get('total_low_priority', 0)})"
-        )
+    @workflow.run
+    async def run(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return await super().run(self._app_input(input_dict))
 
-        # ===== PHASE 5: CREATE ARTICLES =====
-        articles_created = []
 
-        if auto_create and relevant_stories:
-            workflow.logger.info(f"Phase 5: Creating articles for top {max_articles} stories")
+@workflow.defn
+class NewsMonitorRainmakerWorkflow(_AppNewsMonitorWorkflow):
+    """News monitor for the rainmaker app."""
 
-            # Sort by priority (high first) and relevance score
-            sorted_stories = sorted(
-                relevant_stories,
-                key=lambda x: (
-                    0 if x.get("priority") == "high" else (1 if x.get("priority") == "medium" else 2),
-                    -x.get("relevance_score", 0)
-                )
-            )
+    APP = "rainmaker"
 
-            # Create articles for top stories
-            for story_assessment in sorted_stories[:max_articles]:
-                story = story_assessment.get("story", {})
+    @workflow.run
+    async def run(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return await super().run(self._app_input(input_dict))
 
-                workflow.logger.info(f"Creating article: {story.get('title', '')[:50]}...")
 
-                # Build article input
-                article_input = {
-                    "topic": story.get("title", ""),
-                    "article_type": "news",
-                    "app": app,
-                    "research_depth": "standard",
-                    "max_sources": 20,
-                    "exclude_paywalls": True,
-                    # Pass assessment context
-                    "source_url": story.get("url"),
-                    "story_type": story_assessment.get("story_type", "new"),
-                    "suggested_angle": story_assessment.get("suggested_angle"),
-                    "related_entities": story_assessment.get("related_entities", [])
-                }
+@workflow.defn
+class NewsMonitorChiefOfStaffWorkflow(_AppNewsMonitorWorkflow):
+    """News monitor for the chief-of-staff app."""
 
-                # Spawn child workflow
-                try:
-                    result = await workflow.execute_child_workflow(
-                        "ArticleCreationWorkflow",
-                        article_input,
-                        id=f"article-{app}-{workflow.uuid4().hex[:8]}",
-                        task_queue=workflow.info().task_queue
-                    )
-
-                    articles_created.append({
-                        "title": story.get("title"),
-                        "article_id": result.get("article_id"),
-                        "slug": result.get("slug"),
-                        "priority": story_assessment.get("priority"),
-                        "story_type": story_assessment.get("story_type")
-                    })
-
-                    workflow.logger.info(f"Article created: {result.get('slug')}")
-
-                except Exception as e:
-                    workflow.logger.error(f"Failed to create article: {str(e)}")
-
-        # ===== COMPLETE =====
-        workflow.logger.info(
-            f"News Monitor complete for {app}: "
-            f"{len(stories)} found, {len(relevant_stories)} relevant, "
-            f"{len(articles_created)} created"
-        )
+    APP = "chief-of-staff"
 
-        return {
-            "app": app,
-            "keywords": keywords,
-            "stories_found": len(stories),
-            "stories_assessed": assessment_result.get("stories_assessed", 0),
-            "stories_relevant": len(relevant_stories),
-            "articles_created": len(articles_created),
-            "articles": articles_created,
-            "high_priority_count": assessment_result.get("total_high_priority", 0),
-            "medium_priority_count": assessment_result.get("total_medium_priority", 0),
-            "low_priority_count": assessment_result.get("total_low_priority", 0),
-            "cost": news_result.get("cost", 0.0)
-        }
+    @workflow.run
+    async def run(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return await super().run(self._app_input(input_dict))
+
+
+# One specialized workflow type per app
+APP_NEWS_MONITOR_WORKFLOWS: Dict[str, type] = {
+    cls.APP: cls
+    for cls in (
+        NewsMonitorPlacementWorkflow,
+        NewsMonitorRelocationWorkflow,
+        NewsMonitorRainmakerWorkflow,
+        NewsMonitorChiefOfStaffWorkflow,
+    )
+}
 
 
 @workflow.defn
@@ -273,22 +720,22 @@ class NewsMonitorAllAppsWorkflow:
             input_dict: {
                 "apps": ["placement", "relocation", "rainmaker"],
                 "min_relevance_score": 0.7,
-                "max_articles_per_app": 3
+                "max_articles_per_app": 3,
+                "max_concurrency": 3 (max app monitors in flight)
             }
         """
         apps = input_dict.get("apps", list(APP_KEYWORDS.keys()))
         min_relevance = input_dict.get("min_relevance_score", 0.7)
         max_per_app = input_dict.get("max_articles_per_app", 3)
+        max_concurrency = input_dict.get("max_concurrency", 3)
 
         workflow.logger.info(f"News Monitor All Apps: {apps}")
 
-        results = []
-        total_created = 0
-
-        for app in apps:
-            workflow.logger.info(f"Monitoring {app}...")
-
-            result = await workflow.execute_child_workflow(
+        # Each app's pipeline is independent - run children concurrently (bounded)
+        task_queue = workflow.info().task_queue
+        sem = asyncio.Semaphore(max_concurrency)
+        child_runs = [
+            _run_bounded(sem, workflow.execute_child_workflow(
                 "NewsMonitorWorkflow",
                 {
                     "app": app,
@@ -297,11 +744,28 @@ class NewsMonitorAllAppsWorkflow:
                     "max_articles_to_create": max_per_app
                 },
                 id=f"news-monitor-{app}-{workflow.uuid4().hex[:8]}",
-                task_queue=workflow.info().task_queue
-            )
+                task_queue=task_queue
+            ))
+            for app in apps
+        ]
+        if workflow.patched("concurrent-app-monitors"):
+            outcomes = await asyncio.gather(*child_runs, return_exceptions=True)
+        else:
+            # Executions started before the change replay children one by one
+            outcomes = [await child_run for child_run in child_runs]
 
-            results.append(result)
-            total_created += result.get("articles_created", 0)
+        results = []
+        errors = []
+        total_created = 0
+
+        for app, outcome in zip(apps, outcomes):
+            if isinstance(outcome, BaseException):
+                workflow.logger.error(f"News Monitor failed for {app}: {str(outcome)}")
+                errors.append({"app": app, "error": str(outcome)})
+                continue
+
+            results.append(outcome)
+            total_created += outcome.get("articles_created", 0)
 
         workflow.logger.info(
             f"News Monitor All Apps complete: {total_created} articles created"
@@ -310,5 +774,150 @@ class NewsMonitorAllAppsWorkflow:
         return {
             "apps_monitored": len(apps),
             "total_articles_created": total_created,
-            "results_by_app": results
+            "results_by_app": results,
+            "errors": errors
+        }
+
+
+@workflow.defn
+class NewsMonitorAllAppsParallelWorkflow:
+    """
+    All-apps news monitor with a single multi-app LLM assessment.
+
+    Runs every app's pipeline in this workflow: news fetches fan out per
+    app, then one assess_news_batch_multi_app activity assesses all apps'
+    stories in a single LLM call (shared system prompt), then article
+    creation fans out again.
+    """
+
+    @workflow.run
+    async def run(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Monitor news for all configured apps with one shared assessment.
+
+        Args:
+            input_dict: {
+                "apps": ["placement", "relocation", "rainmaker"],
+                "min_relevance_score": 0.7,
+                "max_articles_per_app": 3,
+                "max_concurrency": 3 (max article workflows in flight)
+            }
+        """
+        apps = input_dict.get("apps", list(APP_KEYWORDS.keys()))
+        min_relevance = input_dict.get("min_relevance_score", 0.7)
+        max_per_app = input_dict.get("max_articles_per_app", 3)
+        max_concurrency = input_dict.get("max_concurrency", 3)
+
+        workflow.logger.info(f"News Monitor All Apps (parallel): {apps}")
+
+        results, errors = await monitor_apps_news(
+            [
+                {
+                    "app": app,
+                    "min_relevance_score": min_relevance,
+                    "auto_create_articles": True,
+                    "max_articles_to_create": max_per_app
+                }
+                for app in apps
+            ],
+            asyncio.Semaphore(max_concurrency)
+        )
+
+        total_created = sum(result.get("articles_created", 0) for result in results)
+
+        workflow.logger.info(
+            f"News Monitor All Apps (parallel) complete: {total_created} articles created"
+        )
+
+        return {
+            "apps_monitored": len(apps),
+            "total_articles_created": total_created,
+            "results_by_app": results,
+            "errors": errors
         }
+
+
+# Batcher defaults: flush once this many apps are queued or the interval
+# elapses; continue-as-new before history gets expensive to replay
+BATCHER_BATCH_SIZE = 4
+BATCHER_FLUSH_INTERVAL = timedelta(minutes=5)
+BATCHER_MAX_HISTORY_EVENTS = 10_000
+
+
+@workflow.defn
+class NewsMonitorBatcherWorkflow:
+    """
+    Long-lived workflow that coalesces per-app monitor requests.
+
+    Instead of starting a NewsMonitorWorkflow per app, the gateway's
+    /news-monitor endpoint signals `monitor_app` (signal-with-start on
+    workflow ID news-monitor-batcher) and this workflow runs queued
+    apps together in batches, in its own history, with one multi-app LLM
+    assessment per batch. Continues-as-new when history grows, carrying
+    any still-pending requests.
+    """
+
+    def __init__(self) -> None:
+        self._pending: List[Dict[str, Any]] = []
+
+    @workflow.signal
+    def monitor_app(self, input_dict: Dict[str, Any]) -> None:
+        """Queue a monitor request (NewsMonitorWorkflow input)."""
+        self._pending.append(input_dict)
+
+    @workflow.run
+    async def run(self, input_dict: Dict[str, Any]) -> None:
+        """
+        Process queued monitor requests in batches until continued-as-new.
+
+        Args:
+            input_dict: {
+                "batch_size": 4,
+                "flush_interval_seconds": 300,
+                "max_concurrency": 3 (max article workflows in flight per batch),
+                "pending": [...] (carried over by continue-as-new)
+            }
+        """
+        batch_size = input_dict.get("batch_size", BATCHER_BATCH_SIZE)
+        max_concurrency = input_dict.get("max_concurrency", 3)
+        flush_interval = timedelta(
+            seconds=input_dict.get(
+                "flush_interval_seconds",
+                BATCHER_FLUSH_INTERVAL.total_seconds()
+            )
+        )
+        self._pending[:0] = input_dict.get("pending", [])
+
+        while True:
+            try:
+                await workflow.wait_condition(
+                    lambda: len(self._pending) >= batch_size,
+                    timeout=flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass  # Flush whatever has accumulated
+
+            if self._pending:
+                batch, self._pending = self._pending, []
+                workflow.logger.info(
+                    f"News Monitor batch: {[req.get('app') for req in batch]}"
+                )
+
+                # Per-app failures are logged inside monitor_apps_news
+                results, errors = await monitor_apps_news(
+                    batch, asyncio.Semaphore(max_concurrency)
+                )
+                total_created = sum(result.get("articles_created", 0) for result in results)
+
+                workflow.logger.info(
+                    f"News Monitor batch complete: {total_created} articles created, "
+                    f"{len(errors)} apps failed"
+                )
+
+            if workflow.info().get_current_history_length() > BATCHER_MAX_HISTORY_EVENTS:
+                workflow.continue_as_new({
+                    "batch_size": batch_size,
+                    "flush_interval_seconds": flush_interval.total_seconds(),
+                    "max_concurrency": max_concurrency,
+                    "pending": self._pending
+                })